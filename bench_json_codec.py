@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-Benchmark: stdlib json vs. orjson fuer CRCON-Antworten und State-Datei
+
+Aufruf mit aufgezeichneten Antworten (empfohlen):
+    curl -s -H "Authorization: Bearer $CRCON_API_TOKEN" https://server/api/get_live_scoreboard > scoreboard.json
+    python bench_json_codec.py scoreboard.json logs.json data/state.json
+
+Ohne Argumente werden synthetische Payloads in CRCON-Groesse verwendet
+(100 Spieler im Scoreboard, 500 Log-Eintraege).
+"""
+
+import json
+import sys
+import timeit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def synthetic_payloads():
+    scoreboard = {"result": {"stats": [
+        {
+            "player_id": f"7656119{i:010d}",
+            "player": f"Spieler {i}",
+            "kills": i % 40,
+            "deaths": i % 25,
+            "support": i * 35,
+            "combat": i * 12,
+            "offense": i * 7,
+            "defense": i * 9,
+            "weapons": {"M1 GARAND": i % 20, "THOMPSON": i % 7},
+        }
+        for i in range(100)
+    ]}}
+    logs = {"result": [
+        {
+            "id": 1_000_000 + i,
+            "type": "KILL",
+            "player_name": f"Spieler {i % 100}",
+            "player1_id": f"7656119{i % 100:010d}",
+            "player2_id": f"7656119{(i + 7) % 100:010d}",
+            "raw": f"KILL: Spieler {i % 100}(Allies/7656119{i % 100:010d}) -> Spieler {(i + 7) % 100}(Axis) with M1 GARAND",
+            "event_time": "2024-01-01T12:00:00+00:00",
+        }
+        for i in range(500)
+    ]}
+    return {"get_live_scoreboard": json.dumps(scoreboard).encode(), "get_historical_logs": json.dumps(logs).encode()}
+
+
+def bench(label: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"  {label:<22} {seconds * 1_000_000:10.1f} µs")
+    return seconds
+
+
+def main():
+    if sys.argv[1:]:
+        payloads = {}
+        for path in sys.argv[1:]:
+            with open(path, "rb") as f:
+                payloads[path] = f.read()
+    else:
+        payloads = synthetic_payloads()
+
+    if orjson is None:
+        print("Hinweis: orjson nicht installiert (pip install orjson) - nur stdlib json wird gemessen\n")
+
+    for name, raw in payloads.items():
+        obj = json.loads(raw)
+        number = max(10, 2_000_000 // max(len(raw), 1))
+        print(f"{name} ({len(raw) / 1024:.1f} KiB, {number} Durchlaeufe)")
+        std_loads = bench("json.loads", lambda: json.loads(raw), number)
+        std_dumps = bench("json.dumps indent=2", lambda: json.dumps(obj, ensure_ascii=True, indent=2), number)
+        if orjson is not None:
+            fast_loads = bench("orjson.loads", lambda: orjson.loads(raw), number)
+            fast_dumps = bench("orjson.dumps indent=2", lambda: orjson.dumps(obj, option=orjson.OPT_INDENT_2), number)
+            print(f"  -> Dekodieren {std_loads / fast_loads:.1f}x, Kodieren {std_dumps / fast_dumps:.1f}x schneller")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Speicher-Benchmark: bisherige Dict-Struktur vs. PlayerRecord pro Spieler
+
+Vergleicht fuer mehrere Server mit je 100 Spielern:
+  alt: match_kills/match_support als Dict von Dicts + baseline_kills + kill_offsets
+  neu: ein PlayerRecord (__slots__, internierte Steam-ID) in players + zwei Leaderboards
+
+Aufruf:
+    python bench_player_records.py [server] [spieler_pro_server]
+"""
+
+import sys
+import tracemalloc
+
+from player_stats import Leaderboard, PlayerRecord
+
+
+def fresh_id(i: int) -> str:
+    # Wie aus einer JSON-Antwort: jedes Mal ein neues String-Objekt
+    return "".join(["7656119", f"{i:010d}"])
+
+
+def old_layout(servers: int, players: int) -> list:
+    states = []
+    for s in range(servers):
+        state = {"match_kills": {}, "match_support": {}, "baseline_kills": {}, "kill_offsets": {}}
+        for i in range(players):
+            pid = s * players + i
+            state["match_kills"][fresh_id(pid)] = {"name": f"Spieler {pid}", "kills": i % 40}
+            state["match_support"][fresh_id(pid)] = {"name": f"Spieler {pid}", "support": i * 35}
+            state["baseline_kills"][fresh_id(pid)] = i % 5
+            state["kill_offsets"][fresh_id(pid)] = 0
+        states.append(state)
+    return states
+
+
+def new_layout(servers: int, players: int) -> list:
+    states = []
+    for s in range(servers):
+        state = {"players": {}, "match_kills": Leaderboard("kills"), "match_support": Leaderboard("support")}
+        for i in range(players):
+            pid = s * players + i
+            record = PlayerRecord(fresh_id(pid), f"Spieler {pid}", i % 40, i * 35, i % 5, 0)
+            state["players"][record.steam_id] = record
+            state["match_kills"][record.steam_id] = record
+            state["match_support"][record.steam_id] = record
+        states.append(state)
+    return states
+
+
+def measure(build, servers: int, players: int) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    data = build(servers, players)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del data
+    return size
+
+
+def main():
+    servers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    players = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    old = measure(old_layout, servers, players)
+    new = measure(new_layout, servers, players)
+    total = servers * players
+    print(f"{servers} Server x {players} Spieler")
+    print(f"  alt (Dicts)          {old / 1024:8.1f} KiB  ({old / total:6.0f} B/Spieler)")
+    print(f"  neu (PlayerRecord)   {new / 1024:8.1f} KiB  ({new / total:6.0f} B/Spieler)")
+    print(f"  -> {100 * (1 - new / old):.0f}% weniger Speicher")
+
+
+if __name__ == "__main__":
+    main()
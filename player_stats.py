@@ -0,0 +1,115 @@
+"""
+Kompakte Spieler-Datensaetze und Ranglisten fuer den Top Killer VIP Bot
+"""
+
+import sys
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class PlayerRecord:
+    """Ein Datensatz pro Spieler und Match (statt mehrerer Dicts pro Steam-ID).
+
+    __slots__ spart das Instanz-Dict; die Steam-ID wird interniert, damit
+    alle Tabellen eines Servers denselben String teilen.
+    """
+
+    __slots__ = ("steam_id", "name", "kills", "support", "baseline", "offset")
+
+    def __init__(self, steam_id: str, name: str = "Unknown", kills: int = 0,
+                 support: Optional[int] = None, baseline: int = 0, offset: int = 0):
+        self.steam_id = sys.intern(steam_id)
+        self.name = name
+        self.kills = kills
+        self.support = support
+        self.baseline = baseline
+        self.offset = offset
+
+    def copy(self) -> "PlayerRecord":
+        return PlayerRecord(self.steam_id, self.name, self.kills, self.support, self.baseline, self.offset)
+
+    def to_list(self) -> list:
+        """Kompakte Form fuer die State-Datei: [name, kills, support, baseline, offset]"""
+        return [self.name, self.kills, self.support, self.baseline, self.offset]
+
+    @classmethod
+    def from_list(cls, steam_id: str, values: list) -> "PlayerRecord":
+        return cls(steam_id, *values)
+
+    def __repr__(self) -> str:
+        return (
+            f"PlayerRecord({self.steam_id!r}, name={self.name!r}, kills={self.kills}, "
+            f"support={self.support}, baseline={self.baseline}, offset={self.offset})"
+        )
+
+
+class Leaderboard(dict):
+    """steam_id -> PlayerRecord mit laufend gepflegter Rangliste nach `field`.
+
+    Nach einer Aenderung am Datensatz wird er per erneuter Zuweisung
+    (board[steam_id] = record) per bisect neu einsortiert; top(k) ist O(k).
+    Gleichstand wird nach der Reihenfolge des ersten Eintrags aufgeloest
+    (wie ein stabiles sorted(..., reverse=True)).
+    """
+
+    def __init__(self, field: str, data: Optional[Dict[str, PlayerRecord]] = None):
+        super().__init__()
+        self.field = field
+        self._ranking: List[Tuple[int, int, str]] = []
+        self._keys: Dict[str, Tuple[int, int, str]] = {}
+        self._seq = 0
+        for steam_id, record in (data or {}).items():
+            self[steam_id] = record
+
+    def _unrank(self, steam_id: str):
+        del self._ranking[bisect_left(self._ranking, self._keys[steam_id])]
+
+    def __setitem__(self, steam_id: str, record: PlayerRecord):
+        if steam_id in self._keys:
+            order = self._keys[steam_id][1]
+            self._unrank(steam_id)
+        else:
+            order = self._seq
+            self._seq += 1
+        super().__setitem__(steam_id, record)
+        key = (-(getattr(record, self.field) or 0), order, steam_id)
+        self._keys[steam_id] = key
+        insort(self._ranking, key)
+
+    def __delitem__(self, steam_id: str):
+        self._unrank(steam_id)
+        del self._keys[steam_id]
+        super().__delitem__(steam_id)
+
+    def pop(self, steam_id: str, *default):
+        if steam_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(steam_id)
+        record = dict.__getitem__(self, steam_id)
+        del self[steam_id]
+        return record
+
+    def clear(self):
+        super().clear()
+        self._ranking.clear()
+        self._keys.clear()
+        self._seq = 0
+
+    def update(self, *args, **kwargs):
+        for steam_id, record in dict(*args, **kwargs).items():
+            self[steam_id] = record
+
+    def setdefault(self, steam_id: str, default: Optional[PlayerRecord] = None):
+        if steam_id not in self:
+            self[steam_id] = default if default is not None else PlayerRecord(steam_id)
+        return dict.__getitem__(self, steam_id)
+
+    def top(self, k: int) -> List[Tuple[str, PlayerRecord]]:
+        """Die besten k Spieler als (steam_id, record), O(k)"""
+        return [(steam_id, dict.__getitem__(self, steam_id)) for _, _, steam_id in self._ranking[:k]]
+
+    def ranked(self) -> Iterator[Tuple[str, PlayerRecord]]:
+        """Komplette Rangliste als Iterator (steam_id, record)"""
+        for _, _, steam_id in self._ranking:
+            yield steam_id, dict.__getitem__(self, steam_id)
@@ -6,13 +6,16 @@ Trackt Kills während eines Matches und vergibt den Top 3 Killern ohne VIP +24h
 
 import os
 import sys
+import json
 import time
 import signal
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Dict, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 import urllib3
 
@@ -30,10 +33,53 @@ logger = logging.getLogger('TopKillerVIP')
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# JSON-Codec: orjson (optional, deutlich schneller) oder stdlib json als Fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """JSON aus bytes/str dekodieren"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Environment-Variablen
 API_TOKEN = os.getenv("CRCON_API_TOKEN")
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
 
+# Adaptives Abfrage-Intervall pro Server (Sekunden). Maximal 15s, damit
+# das 500er Log-Fenster von get_historical_logs auch in Gefechten reicht.
+POLL_INTERVAL_MIN_SECONDS = 5
+POLL_INTERVAL_MAX_SECONDS = 15
+
+# Inkrementeller Log-Abruf: Limit aus der beobachteten Log-Rate, bei voller
+# Seite wird mit doppeltem Limit bis zur Watermark zurueckgeblaettert
+LOG_LIMIT_INITIAL = 500
+LOG_LIMIT_MIN = 50
+LOG_LIMIT_MAX = 4000
+LOG_LIMIT_HEADROOM = 2.0
+LOG_RATE_SMOOTHING = 0.3
+# Anzahl zuletzt gesehener Log-IDs oberhalb der Watermark (Duplikat-Erkennung)
+SEEN_LOG_IDS_CAPACITY = 1500
+
+# TTL fuer den VIP-Cache pro Server (Sekunden)
+VIP_CACHE_TTL_SECONDS = int(os.getenv("VIP_CACHE_TTL_SECONDS", "300"))
+
+# PM-Versand: parallele Sendungen pro Server und Retry-Verhalten
+PM_CONCURRENCY = int(os.getenv("PM_CONCURRENCY", "3"))
+PM_MAX_ATTEMPTS = 3
+PM_RETRY_DELAY_SECONDS = 5
+PM_OK = "ok"
+PM_RETRY = "retry"
+PM_FAILED = "failed"
+
+# Wartezeit vor dem ersten Retry eines CRCON-Requests (verdoppelt sich je Versuch)
+HTTP_RETRY_BACKOFF_SECONDS = 0.5
+
 # VIP-Blacklist (keine VIP-Vergabe)
 VIP_EXCLUDE_IDS = {"76561198859268589"}
 VIP_EXCLUDE_NAMES = {"lexman"}
@@ -42,11 +88,25 @@ if not API_TOKEN:
     logger.error("FEHLER: CRCON_API_TOKEN nicht gesetzt!")
     sys.exit(1)
 
+def _http_settings(index: int) -> Dict:
+    """HTTP-Transport fuer Server <index>; SERVER<n>_CRCON_* ueberschreibt CRCON_*"""
+    def setting(name: str, default: float) -> float:
+        return float(os.getenv(f"SERVER{index}_{name}") or os.getenv(name) or default)
+
+    return {
+        "pool_size": int(setting("CRCON_POOL_SIZE", 8)),
+        "connect_timeout": setting("CRCON_CONNECT_TIMEOUT", 5),
+        "read_timeout": setting("CRCON_READ_TIMEOUT", 15),
+        "retries": int(setting("CRCON_GET_RETRIES", 2)),
+        "budget": setting("CRCON_REQUEST_BUDGET", 25),
+    }
+
+
 # Server-Konfiguration
 servers = [
-    {"name": "Server 1", "base_url": os.getenv("SERVER1_URL")},
-    {"name": "Server 2", "base_url": os.getenv("SERVER2_URL")},
-    {"name": "Server 3", "base_url": os.getenv("SERVER3_URL")},
+    {"name": "Server 1", "base_url": os.getenv("SERVER1_URL"), "http": _http_settings(1)},
+    {"name": "Server 2", "base_url": os.getenv("SERVER2_URL"), "http": _http_settings(2)},
+    {"name": "Server 3", "base_url": os.getenv("SERVER3_URL"), "http": _http_settings(3)},
 ]
 
 # Entferne Server ohne URL
@@ -56,6 +116,88 @@ if not servers:
     logger.error("FEHLER: Keine Server-URLs konfiguriert!")
     sys.exit(1)
 
+def _new_http_stats() -> Dict:
+    return {"requests": 0, "retries": 0, "failures": 0, "new_connections": 0, "latency_total": 0.0, "latency_max": 0.0}
+
+
+def _pool_connections(server) -> int:
+    """Anzahl bisher geoeffneter Verbindungen im urllib3-Pool des Servers"""
+    try:
+        adapter = server["session"].get_adapter(server["base_url"])
+        return adapter.poolmanager.connection_from_url(server["base_url"]).num_connections
+    except Exception:
+        return 0
+
+
+def crcon_request(server, method: str, endpoint: str, retry: bool | None = None, budget: float | None = None, **kwargs) -> requests.Response:
+    """CRCON-Request mit (connect, read)-Timeout, Gesamtbudget und Retry.
+
+    Wiederholt werden nur idempotente Abfragen (GET, oder retry=True) bei
+    Verbindungsfehlern, Timeouts, 5xx und 429 - mit exponentiellem Backoff,
+    solange das Zeitbudget reicht.
+    """
+    http = server["http"]
+    stats = server["http_stats"]
+    if retry is None:
+        retry = method == "GET"
+    attempts = 1 + (http["retries"] if retry else 0)
+    deadline = time.monotonic() + (budget or http["budget"])
+    url = f"{server['base_url']}/api/{endpoint}"
+
+    response = None
+    error: Exception | None = None
+    for attempt in range(1, attempts + 1):
+        remaining = deadline - time.monotonic()
+        connections_before = _pool_connections(server)
+        started = time.monotonic()
+        try:
+            response = server["session"].request(
+                method,
+                url,
+                timeout=(min(http["connect_timeout"], remaining), min(http["read_timeout"], remaining)),
+                **kwargs
+            )
+            error = None
+            retryable = response.status_code >= 500 or response.status_code == 429
+        except (requests.ConnectionError, requests.Timeout) as e:
+            response = None
+            error = e
+            retryable = True
+        latency = time.monotonic() - started
+        stats["requests"] += 1
+        stats["new_connections"] += max(0, _pool_connections(server) - connections_before)
+        stats["latency_total"] += latency
+        stats["latency_max"] = max(stats["latency_max"], latency)
+        logger.debug(f"[{server['name']}] {method} {endpoint}: {latency * 1000:.0f}ms (Versuch {attempt}/{attempts})")
+
+        if not retryable or attempt == attempts:
+            break
+        delay = HTTP_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+        if deadline - time.monotonic() <= delay:
+            break
+        stats["retries"] += 1
+        time.sleep(delay)
+
+    if response is None:
+        stats["failures"] += 1
+        raise error
+    return response
+
+
+def log_http_stats(server):
+    """Transport-Kennzahlen seit dem letzten Aufruf loggen und zuruecksetzen"""
+    stats = server["http_stats"]
+    if not stats["requests"]:
+        return
+    reuse = 100 * (1 - stats["new_connections"] / stats["requests"])
+    logger.info(
+        f"[{server['name']}] HTTP: {stats['requests']} Requests, {stats['new_connections']} neue Verbindungen "
+        f"({reuse:.0f}% Wiederverwendung), Latenz avg {stats['latency_total'] / stats['requests'] * 1000:.0f}ms / "
+        f"max {stats['latency_max'] * 1000:.0f}ms, {stats['retries']} Retries, {stats['failures']} Fehler"
+    )
+    server["http_stats"] = _new_http_stats()
+
+
 # Initialisiere Sessions für jeden Server
 for server in servers:
     session = requests.Session()
@@ -64,31 +206,75 @@ for server in servers:
         "Content-Type": "application/json"
     })
     session.verify = False
+    # Keep-Alive-Pool passend zu den parallelen Threads (PMs, _run_blocking)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=server["http"]["pool_size"])
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     server["session"] = session
+    server["http_stats"] = _new_http_stats()
     
     # Teste Verbindung
     try:
-        response = session.get(f"{server['base_url']}/api/get_status", timeout=10)
+        response = crcon_request(server, "GET", "get_status")
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         server["name"] = data.get("result", {}).get("name") or server["name"]
         logger.info(f"✓ Verbunden mit: {server['name']}")
     except Exception as e:
         logger.error(f"✗ Verbindung zu {server['name']} fehlgeschlagen: {e}")
         sys.exit(1)
 
+class SeenLogIds:
+    """Begrenzte, geordnete Duplikat-Erkennung fuer Log-IDs.
+
+    IDs <= floor gelten als gesehen. Darueber merkt sich ein Ring die
+    letzten `capacity` IDs in Einfuegereihenfolge; faellt die aelteste ID
+    heraus, wird floor auf sie angehoben. Pruefen und Einfuegen sind O(1),
+    der Speicher ist fest begrenzt.
+    """
+
+    def __init__(self, capacity: int = SEEN_LOG_IDS_CAPACITY):
+        self.capacity = capacity
+        self.floor = 0
+        self._ring: deque = deque()
+        self._members: set = set()
+
+    def __contains__(self, log_id) -> bool:
+        return log_id in self._members or (log_id is not None and log_id <= self.floor)
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def add(self, log_id) -> bool:
+        """ID merken; False wenn sie bereits gesehen wurde"""
+        if log_id in self:
+            return False
+        self._ring.append(log_id)
+        self._members.add(log_id)
+        if len(self._ring) > self.capacity:
+            evicted = self._ring.popleft()
+            self._members.discard(evicted)
+            if evicted is not None:
+                self.floor = max(self.floor, evicted)
+        return True
+
+
 # Server States
 server_states = {
     server["base_url"]: {
         "last_max_id": 0,
-        "seen_log_ids": set(),
+        "seen_log_ids": SeenLogIds(),
+        "log_rate": 0.0,
+        "log_polled_at": 0.0,
         "current_match_id": None,
         "match_kills": defaultdict(lambda: {"name": "", "kills": 0}),
         "match_start": None,
         "match_rewarded": False,
         "match_end_pending_at": None,
         "timer_below_90s_seen": False,
-        "last_timer": None
+        "last_timer": None,
+        "last_score": 0,
+        "next_poll_at": 0.0
     }
     for server in servers
 }
@@ -109,27 +295,58 @@ def get_historical_logs(server, limit=500) -> List[Dict]:
     """Hole historische Logs vom Server"""
     try:
         payload = {"limit": limit}
-        response = server["session"].post(
-            f"{server['base_url']}/api/get_historical_logs",
-            json=payload,
-            timeout=15
-        )
+        response = crcon_request(server, "POST", "get_historical_logs", json=payload, retry=True)
         response.raise_for_status()
-        return response.json().get("result", [])
+        return json_loads(response.content).get("result", [])
     except Exception as e:
         logger.error(f"Fehler beim Abrufen der Logs von {server['name']}: {e}")
         return []
 
 
+def fetch_new_logs(server, state: Dict) -> List[Dict]:
+    """Hole nur Log-Eintraege neuer als die Watermark (state["last_max_id"]).
+
+    Das Limit richtet sich nach der beobachteten Log-Rate seit dem letzten
+    Abruf. Enthaelt die Seite nur neue Eintraege, wurde die Watermark nicht
+    erreicht: dann wird mit doppeltem Limit erneut abgefragt (bis
+    LOG_LIMIT_MAX), damit in Gefechten keine Kills verloren gehen.
+    Die Watermark selbst setzt erst der Aufrufer nach der Verarbeitung.
+    """
+    watermark = state["last_max_id"]
+    now = time.monotonic()
+    elapsed = now - state["log_polled_at"] if state["log_polled_at"] else POLL_INTERVAL_MAX_SECONDS
+
+    if watermark:
+        expected = state["log_rate"] * elapsed * LOG_LIMIT_HEADROOM
+        limit = min(LOG_LIMIT_MAX, LOG_LIMIT_MIN + int(expected))
+    else:
+        limit = LOG_LIMIT_INITIAL
+
+    while True:
+        logs = get_historical_logs(server, limit=limit)
+        new_logs = [log for log in logs if log.get("id", 0) > watermark]
+        page_full = len(logs) >= limit and len(new_logs) == len(logs)
+        if not watermark or not page_full or limit >= LOG_LIMIT_MAX:
+            break
+        limit = min(LOG_LIMIT_MAX, limit * 2)
+        logger.info(f"[{server['name']}] Log-Seite voll ({len(logs)} neue Eintraege) - blaettere zurueck (limit={limit})")
+
+    if watermark and page_full:
+        logger.warning(f"[{server['name']}] Watermark {watermark} nicht erreicht (limit={limit}) - evtl. fehlen Log-Eintraege")
+
+    if watermark and logs:
+        rate = len(new_logs) / max(elapsed, 1.0)
+        state["log_rate"] = LOG_RATE_SMOOTHING * rate + (1 - LOG_RATE_SMOOTHING) * state["log_rate"]
+    state["log_polled_at"] = now
+    return new_logs
+
+
 def get_current_map(server) -> Tuple[str, str]:
     """Hole aktuelle Map und Match-ID"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_map",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_map")
         response.raise_for_status()
-        result = response.json()
+        result = json_loads(response.content)
         
         # Versuche result zu extrahieren
         data = result.get("result", result)
@@ -166,12 +383,9 @@ def get_current_map(server) -> Tuple[str, str]:
 def get_live_scoreboard(server) -> List[Dict]:
     """Hole Live-Scoreboard für aktuell verbundene Spieler"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_live_scoreboard",
-            timeout=15
-        )
+        response = crcon_request(server, "GET", "get_live_scoreboard")
         response.raise_for_status()
-        return response.json().get("result", [])
+        return json_loads(response.content).get("result", [])
     except Exception as e:
         logger.error(f"Fehler beim Abrufen des Scoreboards von {server['name']}: {e}")
         return []
@@ -180,12 +394,9 @@ def get_live_scoreboard(server) -> List[Dict]:
 def get_live_game_stats(server) -> Dict:
     """Hole Live-Match-Statistiken (bessere Alternative zu gamestate)"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_live_game_stats",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_live_game_stats")
         response.raise_for_status()
-        return response.json().get("result", {})
+        return json_loads(response.content).get("result", {})
     except Exception as e:
         logger.error(f"Fehler beim Abrufen der Live-Stats von {server['name']}: {e}")
         return {}
@@ -194,12 +405,9 @@ def get_live_game_stats(server) -> Dict:
 def get_team_view(server) -> Dict:
     """Hole Team-View mit Live-Support-Punkten"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_team_view",
-            timeout=15
-        )
+        response = crcon_request(server, "GET", "get_team_view")
         response.raise_for_status()
-        return response.json().get("result", {})
+        return json_loads(response.content).get("result", {})
     except Exception as e:
         logger.error(f"Fehler beim Abrufen der Team-View von {server['name']}: {e}")
         return {}
@@ -208,12 +416,9 @@ def get_team_view(server) -> Dict:
 def get_map_scoreboard(server) -> List[Dict]:
     """Hole Match-Scoreboard (Map) vom Server"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_map_scoreboard",
-            timeout=15
-        )
+        response = crcon_request(server, "GET", "get_map_scoreboard")
         response.raise_for_status()
-        return response.json().get("result", [])
+        return json_loads(response.content).get("result", [])
     except Exception as e:
         logger.error(f"Fehler beim Abrufen des Map-Scoreboards von {server['name']}: {e}")
         return []
@@ -222,12 +427,9 @@ def get_map_scoreboard(server) -> List[Dict]:
 def get_gamestate(server) -> Dict:
     """Hole aktuellen Gamestate"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_gamestate",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_gamestate")
         response.raise_for_status()
-        return response.json().get("result", {})
+        return json_loads(response.content).get("result", {})
     except Exception as e:
         logger.error(f"Fehler beim Abrufen des Gamestates von {server['name']}: {e}")
         return {}
@@ -236,12 +438,9 @@ def get_gamestate(server) -> Dict:
 def get_round_time_remaining(server) -> float | None:
     """Hole verbleibende Rundzeit in Sekunden"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_round_time_remaining",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_round_time_remaining")
         response.raise_for_status()
-        return float(response.json().get("result"))
+        return float(json_loads(response.content).get("result"))
     except Exception:
         return None
 
@@ -265,8 +464,8 @@ def extract_scoreboard_players(scoreboard) -> List[Dict]:
         if not players:
             for steam_id, data in scoreboard.items():
                 if isinstance(data, dict):
-                    data["player_id"] = steam_id
-                    players.append(data)
+                    # Kopie statt den Payload zu veraendern
+                    players.append({**data, "player_id": steam_id})
                 elif isinstance(data, list):
                     players.extend([p for p in data if isinstance(p, dict)])
 
@@ -276,38 +475,66 @@ def extract_scoreboard_players(scoreboard) -> List[Dict]:
     return players
 
 
-def get_player_support_points(server, player_id: str = None, player_name: str = None, players: List[Dict] | None = None) -> int | None:
-    """Lese Support-Punkte eines einzelnen Spielers - Priorität: team_view > map_scoreboard > live_scoreboard"""
-    if players is None:
-        # Versuche team_view (beste Quelle für Support)
-        team_view = get_team_view(server)
-        if team_view:
-            players = []
-            for team_key in ("allied", "axis"):
-                team_players = team_view.get(team_key, {}).get("players", [])
-                if isinstance(team_players, list):
-                    players.extend(team_players)
-        
-        # Fallback: Live Scoreboard
-        if not players:
-            scoreboard = get_live_scoreboard(server)
-            players = extract_scoreboard_players(scoreboard)
-
-    def normalize_name(name: str) -> str:
-        return (name or "").strip().casefold()
+def _normalize_name(name: str | None) -> str:
+    return (name or "").strip().casefold()
 
-    target_name = normalize_name(player_name) if player_name else None
 
+def build_player_index(players: List[Dict]) -> Dict:
+    """Index eines Scoreboard-Snapshots (einmal pro Snapshot): player_id bzw. normalisierter Name -> Eintrag"""
+    entries: List[Dict] = []
+    by_id: Dict[str, Dict] = {}
+    by_name: Dict[str, Dict] = {}
     for player in players:
         pid = player.get("player_id") or player.get("steam_id") or player.get("playerid")
         pname = player.get("name") or player.get("player_name") or player.get("player")
+        entry = {
+            "player_id": str(pid) if pid else None,
+            "name": pname,
+            "kills": player.get("kills"),
+            "support": _extract_support_points(player),
+        }
+        entries.append(entry)
+        # Erster Treffer gewinnt (wie bei der bisherigen linearen Suche)
+        if entry["player_id"]:
+            by_id.setdefault(entry["player_id"], entry)
+        if pname:
+            by_name.setdefault(_normalize_name(pname), entry)
+    return {"players": entries, "by_id": by_id, "by_name": by_name}
+
+
+def find_player(index: Dict, player_id: str = None, player_name: str = None) -> Dict | None:
+    """Spieler im Snapshot-Index suchen - zuerst per player_id, dann per Name"""
+    if player_id:
+        entry = index["by_id"].get(str(player_id))
+        if entry is not None:
+            return entry
+    if player_name:
+        return index["by_name"].get(_normalize_name(player_name))
+    return None
 
-        if player_id and pid and str(pid) == str(player_id):
-            return _extract_support_points(player)
-        if target_name and pname and normalize_name(pname) == target_name:
-            return _extract_support_points(player)
 
-    return None
+def get_player_support_points(server, player_id: str = None, player_name: str = None, players: List[Dict] | None = None, index: Dict | None = None) -> int | None:
+    """Lese Support-Punkte eines einzelnen Spielers - Priorität: team_view > map_scoreboard > live_scoreboard"""
+    if index is None:
+        if players is None:
+            # Versuche team_view (beste Quelle für Support)
+            team_view = get_team_view(server)
+            if team_view:
+                players = []
+                for team_key in ("allied", "axis"):
+                    team_players = team_view.get(team_key, {}).get("players", [])
+                    if isinstance(team_players, list):
+                        players.extend(team_players)
+
+            # Fallback: Live Scoreboard
+            if not players:
+                scoreboard = get_live_scoreboard(server)
+                players = extract_scoreboard_players(scoreboard)
+
+        index = build_player_index(players)
+
+    entry = find_player(index, player_id, player_name)
+    return entry["support"] if entry else None
 
 
 def _extract_support_points(player: Dict) -> int | None:
@@ -324,36 +551,56 @@ def _extract_support_points(player: Dict) -> int | None:
     return None
 
 
-def get_vip_ids(server) -> set:
-    """Hole alle Spieler-IDs mit VIP"""
+def _vip_cache(server) -> Dict:
+    return server.setdefault("vip_cache", {"index": None, "fetched_at": 0.0, "hits": 0, "misses": 0})
+
+
+def get_vip_index(server, max_age: float | None = None) -> Dict[str, str | None] | None:
+    """Hole VIP-Liste als Index player_id -> vip_expiration (mit TTL-Cache).
+
+    max_age=0 erzwingt einen frischen Abruf (vor der Vergabe), da VIPs auch
+    ausserhalb dieses Scripts vergeben/verlaengert werden koennen.
+    """
+    cache = _vip_cache(server)
+    ttl = VIP_CACHE_TTL_SECONDS if max_age is None else max_age
+    if cache["index"] is not None and (time.monotonic() - cache["fetched_at"]) < ttl:
+        cache["hits"] += 1
+        return cache["index"]
+
+    cache["misses"] += 1
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_vip_ids",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_vip_ids")
         response.raise_for_status()
-        vips = response.json().get("result", [])
-        return {vip.get("player_id") for vip in vips if vip.get("player_id")}
+        vips = json_loads(response.content).get("result", [])
     except Exception as e:
         logger.error(f"Fehler beim Abrufen der VIP-Liste von {server['name']}: {e}")
-        return set()
+        # Bei Fehlern lieber veraltete Daten als gar keine
+        return cache["index"]
+
+    cache["index"] = {vip.get("player_id"): vip.get("vip_expiration") for vip in vips if vip.get("player_id")}
+    cache["fetched_at"] = time.monotonic()
+    return cache["index"]
+
+
+def _update_vip_cache(server, steam_id: str, expiration: str | None, removed: bool = False):
+    """Write-through nach add_vip/remove_vip, damit der Cache aktuell bleibt"""
+    index = _vip_cache(server)["index"]
+    if index is None:
+        return
+    if removed:
+        index.pop(steam_id, None)
+    else:
+        index[steam_id] = expiration
+
+
+def get_vip_ids(server, max_age: float | None = None) -> set:
+    """Hole alle Spieler-IDs mit VIP"""
+    return set(get_vip_index(server, max_age) or {})
 
 
 def get_vip_expiration(server, steam_id: str) -> str | None:
     """Hole VIP-Expiration fuer eine Spieler-ID."""
-    try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_vip_ids",
-            timeout=10
-        )
-        response.raise_for_status()
-        vips = response.json().get("result", [])
-        for vip in vips:
-            if vip.get("player_id") == steam_id:
-                return vip.get("vip_expiration")
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen der VIP-Daten von {server['name']}: {e}")
-    return None
+    return (get_vip_index(server) or {}).get(steam_id)
 
 
 def is_lifetime_vip(expiration) -> bool:
@@ -405,18 +652,27 @@ def add_vip_hours(server, steam_id: str, player_name: str, hours: int, expiratio
             )
             return True
 
+        if expiration and current_exp:
+            pinned_dt = parse_vip_expiration(expiration)
+            current_dt = parse_vip_expiration(current_exp)
+            if pinned_dt and current_dt and pinned_dt <= current_dt:
+                # Nie eine fruehere Expiration schreiben (VIP wurde inzwischen anderweitig verlaengert)
+                logger.info(
+                    f"[{server['name']}] VIP von {player_name} ({steam_id}) laeuft bereits bis {current_exp} "
+                    f"- Ziel {expiration} wuerde verkuerzen, keine Aenderung."
+                )
+                return True
+
         if current_exp:
             remove_payload = {"player_id": steam_id}
-            remove_response = server["session"].post(
-                f"{server['base_url']}/api/remove_vip",
-                json=remove_payload,
-                timeout=10
-            )
+            remove_response = crcon_request(server, "POST", "remove_vip", json=remove_payload)
             if remove_response.status_code != 200:
                 logger.warning(
                     f"[{server['name']}] Entfernen von VIP fehlgeschlagen fuer {player_name}: "
                     f"{remove_response.status_code} - {remove_response.text[:200]}"
                 )
+            else:
+                _update_vip_cache(server, steam_id, None, removed=True)
 
         expiration = expiration or _compute_award_expiration(server, steam_id, hours)
         if not expiration:
@@ -428,13 +684,10 @@ def add_vip_hours(server, steam_id: str, player_name: str, hours: int, expiratio
             "description": f"Top Killer Belohnung (+{hours}h)"
         }
 
-        response = server["session"].post(
-            f"{server['base_url']}/api/add_vip",
-            json=payload,
-            timeout=10
-        )
+        response = crcon_request(server, "POST", "add_vip", json=payload)
 
         if response.status_code == 200:
+            _update_vip_cache(server, steam_id, expiration)
             logger.info(f"✓ VIP (+{hours}h) vergeben an {player_name} ({steam_id}) auf {server['name']}")
             return True
         else:
@@ -451,8 +704,8 @@ def add_vip_24h(server, steam_id: str, player_name: str) -> bool:
     return add_vip_hours(server, steam_id, player_name, 24)
 
 
-def send_private_message(server, player_id: str, player_name: str, message: str):
-    """Sende private Nachricht an Spieler"""
+def _deliver_private_message(server, player_id: str, player_name: str, message: str) -> str:
+    """Sende private Nachricht an Spieler (PM_OK / PM_RETRY / PM_FAILED)"""
     try:
         payload = {
             "player_id": player_id,
@@ -460,22 +713,67 @@ def send_private_message(server, player_id: str, player_name: str, message: str)
             "by": "Top Killer VIP Bot",
             "player_name": player_name
         }
-        response = server["session"].post(
-            f"{server['base_url']}/api/message_player",
-            json=payload,
-            timeout=10
-        )
+        response = crcon_request(server, "POST", "message_player", json=payload)
         
         if response.status_code == 200:
             logger.info(f"✓ PM gesendet an {player_name} ({player_id}) auf {server['name']}")
-            return True
+            return PM_OK
         else:
             logger.warning(f"PM-Fehler für {player_name}: {response.status_code} - {response.text[:100]}")
-            return False
+            # Nur Server-/Rate-Limit-Fehler sind voruebergehend
+            if response.status_code >= 500 or response.status_code == 429:
+                return PM_RETRY
+            return PM_FAILED
             
     except Exception as e:
         logger.error(f"Fehler beim Senden der PM an {player_name}: {e}")
-        return False
+        return PM_RETRY
+
+
+def send_private_message(server, player_id: str, player_name: str, message: str):
+    """Sende private Nachricht an Spieler"""
+    return _deliver_private_message(server, player_id, player_name, message) == PM_OK
+
+
+class PmDispatcher:
+    """PM-Versand pro Server im Hintergrund (Thread-Pool) mit Retry/Backoff.
+
+    send_batch kehrt sofort zurueck; die Match-Ende-Verarbeitung wartet nie
+    auf message_player.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self._executor = ThreadPoolExecutor(
+            max_workers=PM_CONCURRENCY,
+            thread_name_prefix=f"pm-{server['name']}"
+        )
+
+    def send_batch(self, messages: List[Tuple[str, str, str]]):
+        """Nachrichten (player_id, player_name, message) zum Versand einreihen"""
+        for player_id, player_name, message in messages:
+            self._executor.submit(self._deliver_with_retry, player_id, player_name, message)
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def _deliver_with_retry(self, player_id: str, player_name: str, message: str):
+        for attempt in range(PM_MAX_ATTEMPTS):
+            result = _deliver_private_message(self.server, player_id, player_name, message)
+            if result == PM_OK:
+                return
+            if result == PM_FAILED or shutdown_requested:
+                break
+            if attempt + 1 < PM_MAX_ATTEMPTS:
+                time.sleep(PM_RETRY_DELAY_SECONDS * (2 ** attempt))
+        logger.warning(f"[{self.server['name']}] ⚠️ PM konnte nicht gesendet werden an {player_name} (möglicherweise disconnected)")
+
+
+def _pm_dispatcher(server) -> PmDispatcher:
+    dispatcher = server.get("pm_dispatcher")
+    if dispatcher is None:
+        dispatcher = server["pm_dispatcher"] = PmDispatcher(server)
+    return dispatcher
 
 
 def send_discord_log(message: str):
@@ -512,7 +810,8 @@ def process_match_end(server, state: Dict):
     )
 
     # Hole VIP-Liste
-    vip_ids = get_vip_ids(server)
+    # Frischer Stand vor der Vergabe; danach bleibt der Cache per Write-through aktuell
+    vip_ids = get_vip_ids(server, max_age=0)
 
     # Erstelle Discord-Log
     current_map, _ = get_current_map(server)
@@ -543,8 +842,11 @@ def process_match_end(server, state: Dict):
         logger.warning(f"[{server['name']}] ⚠️ Fallback auf Live-Scoreboard (Support-Punkte ggf. nicht verfügbar)")
         scoreboard_players = extract_scoreboard_players(get_live_scoreboard(server))
     
+    # Index einmal pro Snapshot aufbauen - alle Lookups unten laufen darüber
+    player_index = build_player_index(scoreboard_players)
+
     # Prüfe ob Support-Punkte verfügbar sind
-    support_available = any(_extract_support_points(p) is not None and _extract_support_points(p) > 0 for p in scoreboard_players)
+    support_available = any(entry["support"] is not None and entry["support"] > 0 for entry in player_index["players"])
     if not support_available:
         logger.warning(f"[{server['name']}] ⚠️ Keine Support-Punkte gefunden (möglicherweise erst nach Match verfügbar).")
 
@@ -555,6 +857,7 @@ def process_match_end(server, state: Dict):
     discord_msg += "**🔪 Platz 1-3: +24 Stunden**\n\n"
 
     killer_results = []
+    pm_batch: List[Tuple[str, str, str]] = []
     vip_awarded_count = 0
     last_rank_awarded = 0
 
@@ -565,13 +868,13 @@ def process_match_end(server, state: Dict):
         player_name = data["name"]
         kills = data["kills"]
         has_vip = steam_id in vip_ids
-        is_excluded = str(steam_id) in VIP_EXCLUDE_IDS or (player_name or "").strip().casefold() in VIP_EXCLUDE_NAMES
+        is_excluded = str(steam_id) in VIP_EXCLUDE_IDS or _normalize_name(player_name) in VIP_EXCLUDE_NAMES
 
         support_points = get_player_support_points(
             server,
             player_id=steam_id,
             player_name=player_name,
-            players=scoreboard_players
+            index=player_index
         )
 
         award_success = False
@@ -623,9 +926,7 @@ def process_match_end(server, state: Dict):
                 f"Your VIP has been extended until {expiration}."
             )
             logger.info(f"[{server['name']}] 📨 Sende PM an Top Killer #{rank}: {player_name} ({steam_id})")
-            pm_success = send_private_message(server, steam_id, player_name, pm_message)
-            if not pm_success:
-                logger.warning(f"[{server['name']}] ⚠️ PM konnte nicht gesendet werden an {player_name} (möglicherweise disconnected)")
+            pm_batch.append((steam_id, player_name, pm_message))
 
             logger.info(
                 f"[{server['name']}] ✓ Platz {rank}: {player_name} ({steam_id}) - {kills} Kills{support_text} - +24h VIP"
@@ -644,9 +945,7 @@ def process_match_end(server, state: Dict):
                 f"You placed Top Killer #{rank} with {kills} kills."
             )
             logger.info(f"[{server['name']}] 📨 Sende PM an Top Killer #{rank}: {player_name} ({steam_id})")
-            pm_success = send_private_message(server, steam_id, player_name, pm_message)
-            if not pm_success:
-                logger.warning(f"[{server['name']}] ⚠️ PM konnte nicht gesendet werden an {player_name} (möglicherweise disconnected)")
+            pm_batch.append((steam_id, player_name, pm_message))
 
             discord_msg += (
                 f"• {rank_emoji.get(rank, f'#{rank}')} **{player_name}** - {kills} Kills"
@@ -655,12 +954,12 @@ def process_match_end(server, state: Dict):
 
     # Top Support Benachrichtigungen (bis 2 VIP vergeben)
     support_candidates = []
-    for player in scoreboard_players:
-        pid = player.get("player_id") or player.get("steam_id") or player.get("playerid")
-        pname = player.get("name") or player.get("player_name") or player.get("player") or "Unknown"
-        points = _extract_support_points(player)
+    for entry in player_index["players"]:
+        pid = entry["player_id"]
+        pname = entry["name"] or "Unknown"
+        points = entry["support"]
         if pid and points is not None:
-            if str(pid) in VIP_EXCLUDE_IDS or (pname or "").strip().casefold() in VIP_EXCLUDE_NAMES:
+            if pid in VIP_EXCLUDE_IDS or _normalize_name(pname) in VIP_EXCLUDE_NAMES:
                 continue
             support_candidates.append((pid, pname, points))
 
@@ -680,7 +979,7 @@ def process_match_end(server, state: Dict):
             break
 
         has_vip = pid in vip_ids
-        is_excluded = str(pid) in VIP_EXCLUDE_IDS or (pname or "").strip().casefold() in VIP_EXCLUDE_NAMES
+        is_excluded = str(pid) in VIP_EXCLUDE_IDS or _normalize_name(pname) in VIP_EXCLUDE_NAMES
 
         award_success = False
         expiration = None
@@ -728,9 +1027,7 @@ def process_match_end(server, state: Dict):
                 f"Your VIP has been extended until {expiration}."
             )
             logger.info(f"[{server['name']}] 📨 Sende PM an Top Support #{rank}: {pname} ({pid})")
-            pm_success = send_private_message(server, pid, pname, pm_message)
-            if not pm_success:
-                logger.warning(f"[{server['name']}] ⚠️ PM konnte nicht gesendet werden an {pname} (möglicherweise disconnected)")
+            pm_batch.append((pid, pname, pm_message))
 
             logger.info(
                 f"[{server['name']}] ✓ Support Platz {rank}: {pname} ({pid}) - Support: {points} - +24h VIP"
@@ -742,9 +1039,7 @@ def process_match_end(server, state: Dict):
                 f"You placed Top Support #{rank} with {points} support points."
             )
             logger.info(f"[{server['name']}] 📨 Sende PM an Top Support #{rank}: {pname} ({pid})")
-            pm_success = send_private_message(server, pid, pname, pm_message)
-            if not pm_success:
-                logger.warning(f"[{server['name']}] ⚠️ PM konnte nicht gesendet werden an {pname} (möglicherweise disconnected)")
+            pm_batch.append((pid, pname, pm_message))
 
             discord_msg += f"• {rank_emoji.get(rank, f'#{rank}')} **{pname}** - Support: {points} → keine Belohnung\n"
     
@@ -755,14 +1050,19 @@ def process_match_end(server, state: Dict):
             server,
             player_id=steam_id,
             player_name=data['name'],
-            players=scoreboard_players
+            index=player_index
         )
         support_text = f", Support: {player_support}" if player_support is not None and player_support > 0 else ""
         discord_msg += f"{data['name']} - {data['kills']} Kills{support_text}\n"
     
     discord_msg += f"\n✅ **Match abgeschlossen** • {datetime.now(timezone.utc).strftime('%H:%M Uhr')}"
     
+    # Alle Match-Ende-PMs gesammelt im Hintergrund versenden
+    _pm_dispatcher(server).send_batch(pm_batch)
+
     send_discord_log(discord_msg)
+    cache = _vip_cache(server)
+    logger.info(f"[{server['name']}] VIP-Cache: {cache['hits']} Hits / {cache['misses']} Misses")
     logger.info(f"[{server['name']}] ✓ Match abgeschlossen – Belohnungen vergeben & Discord-Benachrichtigung gesendet")
     
     state["match_rewarded"] = True
@@ -842,11 +1142,13 @@ def process_server(server):
         if remaining is None:
             remaining = get_round_time_remaining(server)
     
+    state["last_score"] = max(allied_score, axis_score)
+
     # Debug: Zeige finale Werte
     logger.info(f"[{server['name']}] 📊 Match State: Timer={remaining}, Score {allied_score}:{axis_score}, Match Rewarded={state['match_rewarded']}, Timer <90s gesehen={state.get('timer_below_90s_seen', False)}")
 
-    # Hole Logs für Kill-Tracking
-    logs = get_historical_logs(server)
+    # Hole neue Logs für Kill-Tracking (inkrementell ab Watermark)
+    logs = fetch_new_logs(server, state)
     
     # Match-Ende Erkennung: 2. Mal Timer ≤90s ODER Score 5:x
     # Regel #1: Score 5:x = Sofortiges Match Ende & Auswertung
@@ -914,18 +1216,14 @@ def process_server(server):
     if not logs:
         return
     
-    # Filtere neue Logs
-    new_logs = [log for log in logs if log.get("id", 0) > state["last_max_id"]]
-    
-    if new_logs:
-        state["last_max_id"] = max(log.get("id", 0) for log in logs)
+    # fetch_new_logs liefert bereits nur Eintraege neuer als die Watermark
+    new_logs = logs
+    state["last_max_id"] = max(log.get("id", 0) for log in new_logs)
     
     # Verarbeite neue Logs
     for log in reversed(new_logs):
-        log_id = log.get("id")
-        if log_id in state["seen_log_ids"]:
+        if not state["seen_log_ids"].add(log.get("id")):
             continue
-        state["seen_log_ids"].add(log_id)
         
         log_type = log.get("type", "").upper()
         
@@ -937,10 +1235,19 @@ def process_server(server):
             if killer_id:
                 state["match_kills"][killer_id]["name"] = killer_name
                 state["match_kills"][killer_id]["kills"] += 1
-    
-    # Cleanup alte IDs
-    if len(state["seen_log_ids"]) > 3000:
-        state["seen_log_ids"] = set(list(state["seen_log_ids"])[-1500:])
+
+
+def _next_poll_interval(state: Dict) -> float:
+    """Abfrage-Intervall je nach Match-Phase (langsam frueh im Match, schnell vor 90s)"""
+    if not state["current_match_id"] or state["match_rewarded"] or state["timer_below_90s_seen"]:
+        return POLL_INTERVAL_MIN_SECONDS
+    if state.get("last_score", 0) >= 4:
+        return POLL_INTERVAL_MIN_SECONDS
+    remaining = state["last_timer"]
+    if remaining is None:
+        return POLL_INTERVAL_MIN_SECONDS
+    # Bis zur 90s-Schwelle hoechstens ein Zehntel der Restzeit warten
+    return max(POLL_INTERVAL_MIN_SECONDS, min(POLL_INTERVAL_MAX_SECONDS, (remaining - 90) / 10))
 
 
 def main():
@@ -962,13 +1269,20 @@ def main():
         try:
             loop_count += 1
             
-            # Verarbeite jeden Server
+            # Verarbeite jeden faelligen Server (adaptives Intervall)
             for server in servers:
+                state = server_states[server["base_url"]]
+                started = time.monotonic()
+                if state["next_poll_at"] > started + POLL_INTERVAL_MIN_SECONDS / 2:
+                    continue
                 process_server(server)
+                state["next_poll_at"] = started + _next_poll_interval(state)
             
             # Status-Log alle 60 Loops (~5 Minuten)
             if loop_count % 60 == 0:
                 logger.info(f"[STATUS] Bot läuft ({loop_count} Loops)")
+                for server in servers:
+                    log_http_stats(server)
             
             # Warte 5 Sekunden
             time.sleep(5)
@@ -979,6 +1293,10 @@ def main():
             logger.error(f"Fehler in Hauptschleife: {e}", exc_info=True)
             time.sleep(10)
     
+    for server in servers:
+        if server.get("pm_dispatcher"):
+            server["pm_dispatcher"].shutdown()
+
     logger.info("\n[SHUTDOWN] Bot beendet")
     send_discord_log("🛑 **Top Killer VIP Bot gestoppt**")
 
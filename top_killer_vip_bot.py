@@ -11,15 +11,22 @@ import logging
 import asyncio
 import json
 import time
+import hashlib
+import heapq
+import random
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from typing import Dict, List, NamedTuple, Tuple, Optional
 import requests
+from requests.adapters import HTTPAdapter
+import aiohttp
 from dotenv import load_dotenv
 import urllib3
 import discord
 from discord.ext import tasks
 
+from player_stats import Leaderboard, PlayerRecord
+
 # Lade Environment-Variablen
 load_dotenv()
 
@@ -34,10 +41,33 @@ logger = logging.getLogger('TopKillerVIP')
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# JSON-Codec: orjson (optional, deutlich schneller) oder stdlib json als Fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """JSON aus bytes/str dekodieren"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """JSON als UTF-8-bytes kodieren"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=True, indent=2 if indent else None).encode("utf-8")
+
+
 # Environment-Variablen
 API_TOKEN = os.getenv("CRCON_API_TOKEN")
 DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 DISCORD_CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID", "0"))
+# Wartezeit vor dem ersten Retry eines CRCON-Requests (verdoppelt sich je Versuch)
+HTTP_RETRY_BACKOFF_SECONDS = 0.5
 
 if not API_TOKEN:
     logger.error("FEHLER: CRCON_API_TOKEN nicht gesetzt!")
@@ -51,11 +81,25 @@ if not DISCORD_CHANNEL_ID:
     logger.error("FEHLER: DISCORD_CHANNEL_ID nicht gesetzt!")
     sys.exit(1)
 
+def _http_settings(index: int) -> Dict:
+    """HTTP-Transport fuer Server <index>; SERVER<n>_CRCON_* ueberschreibt CRCON_*"""
+    def setting(name: str, default: float) -> float:
+        return float(os.getenv(f"SERVER{index}_{name}") or os.getenv(name) or default)
+
+    return {
+        "pool_size": int(setting("CRCON_POOL_SIZE", 8)),
+        "connect_timeout": setting("CRCON_CONNECT_TIMEOUT", 5),
+        "read_timeout": setting("CRCON_READ_TIMEOUT", 15),
+        "retries": int(setting("CRCON_GET_RETRIES", 2)),
+        "budget": setting("CRCON_REQUEST_BUDGET", 25),
+    }
+
+
 # Server-Konfiguration
 servers = [
-    {"name": "Server 1", "base_url": os.getenv("SERVER1_URL")},
-    {"name": "Server 2", "base_url": os.getenv("SERVER2_URL")},
-    {"name": "Server 3", "base_url": os.getenv("SERVER3_URL")},
+    {"name": "Server 1", "base_url": os.getenv("SERVER1_URL"), "http": _http_settings(1)},
+    {"name": "Server 2", "base_url": os.getenv("SERVER2_URL"), "http": _http_settings(2)},
+    {"name": "Server 3", "base_url": os.getenv("SERVER3_URL"), "http": _http_settings(3)},
 ]
 
 # Entferne Server ohne URL
@@ -65,6 +109,88 @@ if not servers:
     logger.error("FEHLER: Keine Server-URLs konfiguriert!")
     sys.exit(1)
 
+def _new_http_stats() -> Dict:
+    return {"requests": 0, "retries": 0, "failures": 0, "new_connections": 0, "latency_total": 0.0, "latency_max": 0.0}
+
+
+def _pool_connections(server) -> int:
+    """Anzahl bisher geoeffneter Verbindungen im urllib3-Pool des Servers"""
+    try:
+        adapter = server["session"].get_adapter(server["base_url"])
+        return adapter.poolmanager.connection_from_url(server["base_url"]).num_connections
+    except Exception:
+        return 0
+
+
+def crcon_request(server, method: str, endpoint: str, retry: Optional[bool] = None, budget: Optional[float] = None, **kwargs) -> requests.Response:
+    """CRCON-Request mit (connect, read)-Timeout, Gesamtbudget und Retry.
+
+    Wiederholt werden nur idempotente Abfragen (GET, oder retry=True) bei
+    Verbindungsfehlern, Timeouts, 5xx und 429 - mit exponentiellem Backoff,
+    solange das Zeitbudget reicht.
+    """
+    http = server["http"]
+    stats = server["http_stats"]
+    if retry is None:
+        retry = method == "GET"
+    attempts = 1 + (http["retries"] if retry else 0)
+    deadline = time.monotonic() + (budget or http["budget"])
+    url = f"{server['base_url']}/api/{endpoint}"
+
+    response = None
+    error: Optional[Exception] = None
+    for attempt in range(1, attempts + 1):
+        remaining = deadline - time.monotonic()
+        connections_before = _pool_connections(server)
+        started = time.monotonic()
+        try:
+            response = server["session"].request(
+                method,
+                url,
+                timeout=(min(http["connect_timeout"], remaining), min(http["read_timeout"], remaining)),
+                **kwargs
+            )
+            error = None
+            retryable = response.status_code >= 500 or response.status_code == 429
+        except (requests.ConnectionError, requests.Timeout) as e:
+            response = None
+            error = e
+            retryable = True
+        latency = time.monotonic() - started
+        stats["requests"] += 1
+        stats["new_connections"] += max(0, _pool_connections(server) - connections_before)
+        stats["latency_total"] += latency
+        stats["latency_max"] = max(stats["latency_max"], latency)
+        logger.debug(f"[{server['name']}] {method} {endpoint}: {latency * 1000:.0f}ms (Versuch {attempt}/{attempts})")
+
+        if not retryable or attempt == attempts:
+            break
+        delay = HTTP_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+        if deadline - time.monotonic() <= delay:
+            break
+        stats["retries"] += 1
+        time.sleep(delay)
+
+    if response is None:
+        stats["failures"] += 1
+        raise error
+    return response
+
+
+def log_http_stats(server):
+    """Transport-Kennzahlen seit dem letzten Aufruf loggen und zuruecksetzen"""
+    stats = server["http_stats"]
+    if not stats["requests"]:
+        return
+    reuse = 100 * (1 - stats["new_connections"] / stats["requests"])
+    logger.info(
+        f"[{server['name']}] HTTP: {stats['requests']} Requests, {stats['new_connections']} neue Verbindungen "
+        f"({reuse:.0f}% Wiederverwendung), Latenz avg {stats['latency_total'] / stats['requests'] * 1000:.0f}ms / "
+        f"max {stats['latency_max'] * 1000:.0f}ms, {stats['retries']} Retries, {stats['failures']} Fehler"
+    )
+    server["http_stats"] = _new_http_stats()
+
+
 # Initialisiere Sessions fÃ¼r jeden Server
 for server in servers:
     session = requests.Session()
@@ -73,13 +199,18 @@ for server in servers:
         "Content-Type": "application/json"
     })
     session.verify = False
+    # Keep-Alive-Pool passend zu den parallelen Threads (PMs, _run_blocking)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=server["http"]["pool_size"])
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     server["session"] = session
+    server["http_stats"] = _new_http_stats()
     
     # Teste Verbindung
     try:
-        response = session.get(f"{server['base_url']}/api/get_status", timeout=10)
+        response = crcon_request(server, "GET", "get_status")
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         server["name"] = data.get("result", {}).get("name") or server["name"]
         logger.info(f"âœ“ Verbunden mit: {server['name']}")
     except Exception as e:
@@ -90,11 +221,11 @@ for server in servers:
 server_states = {
     server["base_url"]: {
         "current_match_id": None,
-        "match_kills": defaultdict(lambda: {"name": "", "kills": 0}),
-        "match_support": defaultdict(lambda: {"name": "", "support": 0}),
+        "match_kills": Leaderboard("kills"),
+        "match_support": Leaderboard("support"),
         "support_available": False,
-        "baseline_kills": {},
-        "kill_offsets": {},
+        # steam_id -> PlayerRecord (Name, Kills, Support, Baseline, Offset)
+        "players": {},
         "match_start": None,
         "match_rewarded": False,
         "timer_below_90s_seen": False,
@@ -105,10 +236,25 @@ server_states = {
         "paused_low_pop": False,
         "live_message": None,  # Discord Message fÃ¼r Live-Updates
         "live_message_id": None,
+        "live_fingerprint": None,
+        "live_last_edit": 0.0,
         "last_update": None,   # Timestamp des letzten Updates
         "inactive_since": None,
+        "inactive_failures": 0,
         "current_map": None,
-        "support_debug_logged": False
+        "support_debug_logged": False,
+        "ingest_key": None,
+        "rows_version": 0,
+        "live_rows_version": -1,
+        "live_view": None,
+        "log_kills": {},
+        "log_cursor": {"watermark": 0, "rate": 0.0, "polled_at": 0.0},
+        "reconcile_at": 0.0,
+        "scoreboard_digest": None,
+        # endpoint -> ScoreboardSchema (Layout-Erkennung nur bei Aenderung)
+        "payload_schemas": {},
+        "scoreboard_players": [],
+        "next_poll_at": 0.0
     }
     for server in servers
 }
@@ -121,9 +267,56 @@ bot = discord.Client(intents=intents)
 # Graceful Shutdown Handler
 shutdown_requested = False
 last_channel_warning = 0.0
-last_state_write = 0.0
-STATE_WRITE_MIN_SECONDS = 20
+# Zuletzt persistierter State (Snapshot + Journal) als Basis fuer die Deltas
+persisted_state: Optional[Dict] = None
+state_journal_seq = 0
+# Journal-Sequenz des letzten Snapshots (gleich state_journal_seq = Journal leer)
+state_snapshot_seq = 0
+last_state_compaction = 0.0
+STATE_COMPACT_SECONDS = 300
+STATE_JOURNAL_MAX_BYTES = 512 * 1024
+MAX_CONCURRENT_SERVERS = int(os.getenv("MAX_CONCURRENT_SERVERS", "4"))
+POLL_INTERVAL_MIN_SECONDS = 5
+POLL_INTERVAL_MAX_SECONDS = int(os.getenv("POLL_INTERVAL_MAX_SECONDS", "30"))
+POLL_INTERVAL_IDLE_SECONDS = 30
+INACTIVE_BACKOFF_BASE_SECONDS = 10
+INACTIVE_BACKOFF_MAX_SECONDS = int(os.getenv("INACTIVE_BACKOFF_MAX_SECONDS", "300"))
+INACTIVE_PROBE_TIMEOUT_SECONDS = 5
+
+# Kill-Tracking: "scoreboard" (Standard, Diff gegen Baseline) oder "logs"
+# (Kill-Events aus get_historical_logs, Abgleich mit dem Scoreboard alle
+# KILL_RECONCILE_SECONDS)
+KILL_TRACKING_MODE = os.getenv("KILL_TRACKING_MODE", "scoreboard").strip().lower()
+KILL_RECONCILE_SECONDS = int(os.getenv("KILL_RECONCILE_SECONDS", "60"))
+LOG_LIMIT_INITIAL = 500
+LOG_LIMIT_MIN = 50
+LOG_LIMIT_MAX = 4000
+LOG_LIMIT_HEADROOM = 2.0
+LOG_RATE_SMOOTHING = 0.3
+VIP_CACHE_TTL_SECONDS = int(os.getenv("VIP_CACHE_TTL_SECONDS", "300"))
+ENDPOINT_BREAKER_THRESHOLD = 3  # Fehlschlaege bis ein optionaler Endpoint gesperrt wird
+ENDPOINT_BREAKER_OPEN_SECONDS = 300
+ENDPOINT_BREAKER_MAX_OPEN_SECONDS = 1800
+poll_semaphore: Optional[asyncio.Semaphore] = None
+state_write_lock: Optional[asyncio.Lock] = None
+background_tasks: set = set()
 STATE_FILE = os.path.join("data", "state.json")
+STATE_JOURNAL_FILE = os.path.join("data", "state.journal")
+AWARD_JOURNAL_FILE = os.path.join("data", "award_journal.json")
+AWARD_WORKERS = int(os.getenv("AWARD_WORKERS", "4"))
+AWARD_MAX_ATTEMPTS = 5
+AWARD_RETRY_DELAY_SECONDS = 10
+AWARD_JOURNAL_RETENTION_DAYS = 7
+LIVE_EDIT_MIN_SECONDS = float(os.getenv("LIVE_EDIT_MIN_SECONDS", "10"))
+LIVE_TIMER_BUCKET_SECONDS = 30
+DISCORD_WRITES_PER_WINDOW = 5
+DISCORD_WRITE_WINDOW_SECONDS = 5.0
+PM_CONCURRENCY = int(os.getenv("PM_CONCURRENCY", "3"))
+PM_MAX_ATTEMPTS = 3
+PM_RETRY_DELAY_SECONDS = 5
+PM_OK = "ok"
+PM_RETRY = "retry"
+PM_FAILED = "failed"
 RESTART_HOUR = 4
 RESTART_MINUTE = 30
 
@@ -141,6 +334,7 @@ EMOJI_BAR_CHART = "\U0001F4CA"
 EMOJI_VIP = "\U0001F451"
 EMOJI_CHECK = "\u2713"
 EMOJI_CROSS = "\u2717"
+EMOJI_PENDING = "\u23F3"
 
 def signal_handler(sig, frame):
     global shutdown_requested
@@ -172,14 +366,88 @@ def _serialize_datetime(value: Optional[datetime]) -> Optional[str]:
     return value.isoformat()
 
 
+def _load_player_records(state: Dict, saved: Dict):
+    """Spieler-Datensaetze aus der State-Datei (auch altes Format) laden"""
+    players: Dict[str, PlayerRecord] = {}
+    if "players" in saved:
+        for steam_id, values in saved["players"].items():
+            record = PlayerRecord.from_list(steam_id, values)
+            players[record.steam_id] = record
+    else:
+        # Altes Format: match_kills/baseline_kills/kill_offsets als eigene Dicts
+        for steam_id, data in saved.get("match_kills", {}).items():
+            players[steam_id] = PlayerRecord(steam_id, data.get("name") or "Unknown", data.get("kills", 0))
+        for key, attr in (("baseline_kills", "baseline"), ("kill_offsets", "offset")):
+            for steam_id, value in saved.get(key, {}).items():
+                record = players.get(steam_id) or players.setdefault(steam_id, PlayerRecord(steam_id))
+                setattr(record, attr, value)
+
+    state["players"] = {record.steam_id: record for record in players.values()}
+    state["match_kills"] = Leaderboard("kills", {
+        steam_id: record for steam_id, record in state["players"].items() if record.kills > 0
+    })
+    state["match_support"] = Leaderboard("support", {
+        steam_id: record for steam_id, record in state["players"].items() if record.support is not None
+    })
+
+
+def _apply_state_delta(data: Dict, delta: Dict):
+    """Ein Journal-Delta auf den gespeicherten State (Dateiformat) anwenden"""
+    op = delta.get("op")
+    if op == "restart":
+        data["last_restart_date"] = delta.get("date")
+        return
+    servers_data = data.setdefault("servers", {})
+    if op == "match":
+        servers_data[delta["server"]] = delta["state"]
+        return
+    saved = servers_data.setdefault(delta["server"], {"players": {}})
+    if op == "set":
+        saved.update(delta["fields"])
+    elif op == "players":
+        saved.setdefault("players", {}).update(delta["upsert"])
+    elif op == "drop":
+        for steam_id in delta["players"]:
+            saved.get("players", {}).pop(steam_id, None)
+
+
+def _replay_state_journal(data: Dict) -> int:
+    """Journal-Eintraege nach dem Snapshot nachspielen; gibt die letzte Sequenznummer zurueck"""
+    seq = data.get("journal_seq", 0)
+    if not os.path.exists(STATE_JOURNAL_FILE):
+        return seq
+
+    replayed = 0
+    with open(STATE_JOURNAL_FILE, "rb") as f:
+        for line in f:
+            try:
+                entry = json_loads(line)
+            except Exception:
+                # Abgebrochener letzter Eintrag (Crash beim Schreiben) - Rest verwerfen
+                logger.warning(f"{STATE_JOURNAL_FILE}: unvollstaendiger Eintrag nach Seq {seq} ignoriert")
+                break
+            if entry.get("seq", 0) <= seq:
+                continue
+            for delta in entry.get("deltas", []):
+                _apply_state_delta(data, delta)
+            seq = entry["seq"]
+            replayed += 1
+    if replayed:
+        logger.info(f"✓ State-Journal: {replayed} Eintraege nachgespielt")
+    return seq
+
+
 def load_state():
-    global last_restart_date
-    if not os.path.exists(STATE_FILE):
+    global last_restart_date, state_journal_seq
+    if not os.path.exists(STATE_FILE) and not os.path.exists(STATE_JOURNAL_FILE):
         return
 
     try:
-        with open(STATE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = {}
+        if os.path.exists(STATE_FILE):
+            with open(STATE_FILE, "rb") as f:
+                data = json_loads(f.read())
+        state_journal_seq = _replay_state_journal(data)
     except Exception as e:
         logger.error(f"Fehler beim Laden von {STATE_FILE}: {e}")
         return
@@ -195,9 +463,7 @@ def load_state():
 
         state = server_states[base_url]
         state["current_match_id"] = saved.get("current_match_id")
-        state["match_kills"] = defaultdict(lambda: {"name": "", "kills": 0}, saved.get("match_kills", {}))
-        state["baseline_kills"] = saved.get("baseline_kills", {})
-        state["kill_offsets"] = saved.get("kill_offsets", {})
+        _load_player_records(state, saved)
         state["match_start"] = _parse_datetime(saved.get("match_start"))
         state["match_rewarded"] = saved.get("match_rewarded", False)
         state["timer_below_90s_seen"] = saved.get("timer_below_90s_seen", False)
@@ -213,13 +479,8 @@ def load_state():
     logger.info("✓ State geladen")
 
 
-def save_state(force: bool = False):
-    global last_state_write
-    now_ts = time.time()
-    if not force and (now_ts - last_state_write) < STATE_WRITE_MIN_SECONDS:
-        return
-
-    ensure_data_dir()
+def _state_payload() -> Dict:
+    """Momentaufnahme des States (auf dem Event-Loop, nur frische Listen/Dicts)"""
     payload = {
         "last_restart_date": last_restart_date,
         "servers": {}
@@ -230,9 +491,7 @@ def save_state(force: bool = False):
         state = server_states[base_url]
         payload["servers"][base_url] = {
             "current_match_id": state.get("current_match_id"),
-            "match_kills": dict(state.get("match_kills", {})),
-            "baseline_kills": state.get("baseline_kills", {}),
-            "kill_offsets": state.get("kill_offsets", {}),
+            "players": {steam_id: record.to_list() for steam_id, record in state["players"].items()},
             "match_start": _serialize_datetime(state.get("match_start")),
             "match_rewarded": state.get("match_rewarded", False),
             "timer_below_90s_seen": state.get("timer_below_90s_seen", False),
@@ -245,196 +504,142 @@ def save_state(force: bool = False):
             "inactive_since": _serialize_datetime(state.get("inactive_since")),
             "current_map": state.get("current_map")
         }
-
-    try:
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=True, indent=2)
-        last_state_write = now_ts
-    except Exception as e:
-        logger.error(f"Fehler beim Speichern von {STATE_FILE}: {e}")
-
-
-def get_live_scoreboard(server):
-    """Hole Live-Scoreboard fÃ¼r aktuell verbundene Spieler"""
-    try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_live_scoreboard",
-            timeout=15
-        )
-        response.raise_for_status()
-        result = response.json().get("result", [])
-        # result kann Liste oder Dict sein
-        return result
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen des Scoreboards von {server['name']}: {e}")
-        return None
+    return payload
 
 
-def get_players(server):
-    """Hole Live-Players vom Server (enthÃ¤lt oft Support-Punkte)"""
+def _write_file_atomic(path: str, data: bytes):
+    """Atomar schreiben: Temp-Datei + fsync + rename (keine halb geschriebene Datei)"""
+    ensure_data_dir()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    # Rename selbst dauerhaft machen (nicht auf allen Plattformen moeglich)
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_players",
-            timeout=15
-        )
-        response.raise_for_status()
-        return response.json().get("result", [])
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen der Players von {server['name']}: {e}")
-        return None
-
-
-def get_map_scoreboard(server):
-    """Hole Match-Scoreboard (Map) vom Server"""
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    except OSError:
+        return
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_map_scoreboard",
-            timeout=15
-        )
-        response.raise_for_status()
-        return response.json().get("result", [])
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen des Map-Scoreboards von {server['name']}: {e}")
-        return None
-
-
-def extract_scoreboard_players(scoreboard) -> List[Dict]:
-    """Extrahiere Spieler-Liste aus unterschiedlichen Scoreboard-Formaten"""
-    players: List[Dict] = []
-
-    if isinstance(scoreboard, dict):
-        # Team-Keys
-        for team_key in ("allied", "axis", "team1", "team2"):
-            team_players = scoreboard.get(team_key)
-            if isinstance(team_players, list):
-                players.extend([p for p in team_players if isinstance(p, dict)])
-
-        # stats-Array
-        if not players and isinstance(scoreboard.get("stats"), list):
-            players = [p for p in scoreboard.get("stats", []) if isinstance(p, dict)]
-
-        # players-Array
-        if not players and isinstance(scoreboard.get("players"), list):
-            players = [p for p in scoreboard.get("players", []) if isinstance(p, dict)]
-
-        # Dict mit steam_id als Keys
-        if not players:
-            for steam_id, data in scoreboard.items():
-                if isinstance(data, dict):
-                    data["player_id"] = steam_id
-                    players.append(data)
-                elif isinstance(data, list):
-                    players.extend([p for p in data if isinstance(p, dict)])
-
-    elif isinstance(scoreboard, list):
-        players = [p for p in scoreboard if isinstance(p, dict)]
-
-    return players
-
-
-def _extract_support_points(player: Dict) -> Optional[int]:
-    """Support-Punkte aus Spieler-Objekt extrahieren (verschiedene mögliche Keys)."""
-    for key in (
-        "support", "support_points", "support_score", "score_support",
-        "supportScore", "supportPoints", "supp"
-    ):
-        if key in player and player[key] is not None:
-            try:
-                if isinstance(player[key], dict):
-                    for subkey in ("score", "value", "total", "points"):
-                        if subkey in player[key] and player[key][subkey] is not None:
-                            return int(player[key][subkey])
-                    return None
-                return int(player[key])
-            except (ValueError, TypeError):
-                return None
-
-    score_block = player.get("score") or player.get("scores")
-    if isinstance(score_block, dict):
-        for key in ("support", "support_score", "support_points"):
-            if key in score_block and score_block[key] is not None:
-                try:
-                    return int(score_block[key])
-                except (ValueError, TypeError):
-                    return None
-
-    return None
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _state_deltas(old: Dict, new: Dict) -> List[Dict]:
+    """Unterschiede zwischen zwei State-Momentaufnahmen als Journal-Deltas"""
+    deltas = []
+    if old.get("last_restart_date") != new["last_restart_date"]:
+        deltas.append({"op": "restart", "date": new["last_restart_date"]})
+    for base_url, saved in new["servers"].items():
+        previous = old["servers"].get(base_url)
+        if previous is None or previous.get("current_match_id") != saved.get("current_match_id"):
+            # Neues Match: kompletter Server-State statt vieler Einzel-Deltas
+            deltas.append({"op": "match", "server": base_url, "state": saved})
+            continue
+        fields = {key: value for key, value in saved.items() if key != "players" and previous.get(key) != value}
+        if fields:
+            deltas.append({"op": "set", "server": base_url, "fields": fields})
+        old_players = previous["players"]
+        upsert = {steam_id: values for steam_id, values in saved["players"].items() if old_players.get(steam_id) != values}
+        if upsert:
+            deltas.append({"op": "players", "server": base_url, "upsert": upsert})
+        dropped = [steam_id for steam_id in old_players if steam_id not in saved["players"]]
+        if dropped:
+            deltas.append({"op": "drop", "server": base_url, "players": dropped})
+    return deltas
+
+
+def _append_state_journal(data: bytes) -> int:
+    """Journal-Eintrag anhaengen und fsyncen; gibt die Journal-Groesse zurueck"""
+    ensure_data_dir()
+    with open(STATE_JOURNAL_FILE, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def _compact_state(payload: Dict, seq: int):
+    """Snapshot atomar schreiben, danach das Journal leeren"""
+    _write_file_atomic(STATE_FILE, json_dumps({**payload, "journal_seq": seq}, indent=True))
+    # Crash zwischen Snapshot und Leeren ist harmlos: Replay ueberspringt seq <= journal_seq
+    with open(STATE_JOURNAL_FILE, "wb") as f:
+        os.fsync(f.fileno())
+
+
+async def save_state(force: bool = False):
+    """Aenderungen seit dem letzten Aufruf ans Journal anhaengen (Hintergrund-Thread).
+
+    Periodisch, bei zu grossem Journal oder mit force=True wird stattdessen
+    ein kompletter Snapshot geschrieben und das Journal geleert.
+    """
+    global persisted_state, state_journal_seq, state_snapshot_seq, last_state_compaction
+    async with state_write_lock:
+        # Momentaufnahme erst unter dem Lock, damit Deltas in Reihenfolge bleiben
+        payload = _state_payload()
+        try:
+            now_ts = time.time()
+            compact = force or persisted_state is None or (now_ts - last_state_compaction) >= STATE_COMPACT_SECONDS
+            if not compact:
+                deltas = _state_deltas(persisted_state, payload)
+                if not deltas:
+                    return
+                state_journal_seq += 1
+                entry = json_dumps({"seq": state_journal_seq, "deltas": deltas}) + b"\n"
+                journal_size = await _run_blocking(_append_state_journal, entry)
+                persisted_state = payload
+                if journal_size < STATE_JOURNAL_MAX_BYTES:
+                    return
+            elif payload == persisted_state and state_journal_seq == state_snapshot_seq:
+                # Snapshot ist aktuell und das Journal leer - nichts zu schreiben
+                last_state_compaction = now_ts
+                return
+            await _run_blocking(_compact_state, payload, state_journal_seq)
+            persisted_state = payload
+            state_snapshot_seq = state_journal_seq
+            last_state_compaction = now_ts
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern von {STATE_FILE}: {e}")
 
 
-def get_live_game_stats(server) -> Dict:
-    """Hole Live-Game-Stats mit Timer und Score"""
+def _to_int(value: object) -> int:
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_live_game_stats",
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json().get("result", {})
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen der Live-Stats von {server['name']}: {e}")
-        return {}
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
 
 
-def get_gamestate(server) -> Dict:
-    """Hole aktuellen Gamestate (Fallback für Timer/Score)"""
+def _coerce_timer(value: Optional[object]) -> Optional[float]:
+    if value is None:
+        return None
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_gamestate",
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json().get("result", {})
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen des Gamestates von {server['name']}: {e}")
-        return {}
-
-
-def get_round_time_remaining(server) -> Optional[float]:
-    """Hole verbleibende Rundzeit in Sekunden (Fallback)."""
+        return float(value)
+    except (ValueError, TypeError):
+        pass
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_round_time_remaining",
-            timeout=10
-        )
-        response.raise_for_status()
-        return float(response.json().get("result"))
+        parts = str(value).strip().split(":")
+        if len(parts) == 3:
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+        if len(parts) == 2:
+            return int(parts[0]) * 60 + int(parts[1])
     except Exception:
         return None
+    return None
 
 
-def get_match_timer_and_score(server) -> Tuple[Optional[float], int, int]:
-    """Hole Timer und Score aus Live-Stats mit Fallbacks."""
-    live_stats = get_live_game_stats(server)
+def _timer_and_score_from_live_stats(live_stats: Dict) -> Tuple[Optional[float], int, int]:
+    """Timer und Score aus get_live_game_stats extrahieren (inkl. stats-Block)."""
     timer_remaining = live_stats.get("time_remaining") or live_stats.get("remaining_time")
     allied_score = live_stats.get("allied_score", 0) or live_stats.get("allied", {}).get("score", 0)
     axis_score = live_stats.get("axis_score", 0) or live_stats.get("axis", {}).get("score", 0)
 
-    def _to_int(value: object) -> int:
-        try:
-            return int(float(value))
-        except (TypeError, ValueError):
-            return 0
-
     allied_score = _to_int(allied_score)
     axis_score = _to_int(axis_score)
 
-    def _coerce_timer(value: Optional[object]) -> Optional[float]:
-        if value is None:
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            pass
-        try:
-            parts = str(value).strip().split(":")
-            if len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            if len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
-        except Exception:
-            return None
-        return None
-
     stats_block = live_stats.get("stats")
     if stats_block and (timer_remaining is None or (allied_score == 0 and axis_score == 0)):
         if isinstance(stats_block, dict):
@@ -469,25 +674,94 @@ def get_match_timer_and_score(server) -> Tuple[Optional[float], int, int]:
                 if timer_remaining is not None and (allied_score > 0 or axis_score > 0):
                     break
 
-    if timer_remaining is None or (allied_score == 0 and axis_score == 0):
-        gamestate = get_gamestate(server)
-        if isinstance(gamestate, dict):
-            if timer_remaining is None:
-                timer_str = (
-                    gamestate.get("remaining_time") or
-                    gamestate.get("time_remaining") or
-                    gamestate.get("raw_time_remaining")
-                )
+    return timer_remaining, allied_score, axis_score
 
-                if timer_str:
-                    timer_remaining = _coerce_timer(timer_str)
 
-            if allied_score == 0 and axis_score == 0:
-                allied_score = _to_int(gamestate.get("allied_score", 0) or gamestate.get("score_allied", 0))
-                axis_score = _to_int(gamestate.get("axis_score", 0) or gamestate.get("score_axis", 0))
+_GAMESTATE_TIMER_KEYS = ("remaining_time", "time_remaining", "raw_time_remaining")
+_GAMESTATE_SCORE_KEYS = ("allied_score", "score_allied", "axis_score", "score_axis")
+
+
+def _gamestate_has_fields(gamestate) -> bool:
+    """True, wenn get_gamestate ueberhaupt Timer-/Score-Felder liefert (auch 0:0)."""
+    return isinstance(gamestate, dict) and any(
+        gamestate.get(key) is not None for key in _GAMESTATE_TIMER_KEYS + _GAMESTATE_SCORE_KEYS
+    )
+
+
+def _apply_gamestate_fallback(
+    gamestate: Dict,
+    timer_remaining: Optional[float],
+    allied_score: int,
+    axis_score: int
+) -> Tuple[Optional[float], int, int]:
+    """Fehlende Timer-/Score-Werte aus get_gamestate ergaenzen."""
+    if not isinstance(gamestate, dict):
+        return timer_remaining, allied_score, axis_score
+
+    if timer_remaining is None:
+        timer_str = (
+            gamestate.get("remaining_time") or
+            gamestate.get("time_remaining") or
+            gamestate.get("raw_time_remaining")
+        )
+
+        if timer_str:
+            timer_remaining = _coerce_timer(timer_str)
+
+    if allied_score == 0 and axis_score == 0:
+        allied_score = _to_int(gamestate.get("allied_score", 0) or gamestate.get("score_allied", 0))
+        axis_score = _to_int(gamestate.get("axis_score", 0) or gamestate.get("score_axis", 0))
+
+    return timer_remaining, allied_score, axis_score
+
+
+def _extract_current_map(server, result) -> str:
+    """Map-Namen aus get_map Antwort extrahieren."""
+    data = result.get("result", result) if isinstance(result, dict) else result
+
+    current_map = None
+    if isinstance(data, dict):
+        current_map = (
+            data.get("id") or 
+            data.get("map") or 
+            data.get("name") or
+            data.get("map_name") or
+            data.get("layer") or
+            data.get("layer_name")
+        )
+    elif isinstance(data, str):
+        current_map = data
+    
+    if not current_map or current_map == "Unknown":
+        logger.warning(f"[{server['name']}] Konnte Map nicht extrahieren.")
+        current_map = "Unknown"
+    return current_map
+
+
+async def resolve_match_timer_and_score(server, source) -> Tuple[Optional[float], int, int]:
+    """Timer und Score ueber live_game_stats -> gamestate -> round_time_remaining aufloesen.
+
+    ``source`` ist ein AsyncCrconClient oder ein CrconTickSnapshot.
+    """
+    live_stats = await source.get_live_game_stats()
+    timer_remaining, allied_score, axis_score = _timer_and_score_from_live_stats(live_stats)
+    # Auch leere Antworten melden, sonst oeffnet der Breaker bei "immer leer" nie
+    source.report_endpoint(
+        "get_live_game_stats",
+        timer_remaining is not None or allied_score > 0 or axis_score > 0
+    )
+
+    if timer_remaining is None or (allied_score == 0 and axis_score == 0):
+        gamestate = await source.get_gamestate()
+        timer_remaining, allied_score, axis_score = _apply_gamestate_fallback(
+            gamestate, timer_remaining, allied_score, axis_score
+        )
+        # Brauchbar = Felder vorhanden; ein echtes 0:0 zu Matchbeginn aendert nichts, ist aber gueltig
+        source.report_endpoint("get_gamestate", _gamestate_has_fields(gamestate))
 
     if timer_remaining is None:
-        timer_remaining = get_round_time_remaining(server)
+        timer_remaining = await source.get_round_time_remaining()
+        source.report_endpoint("get_round_time_remaining", timer_remaining is not None)
 
     logger.info(
         f"[{server['name']}] Live Match State: Timer={timer_remaining}, Score {allied_score}:{axis_score}, "
@@ -496,51 +770,555 @@ def get_match_timer_and_score(server) -> Tuple[Optional[float], int, int]:
     return timer_remaining, allied_score, axis_score
 
 
-def get_current_map(server) -> Tuple[str, str]:
-    """Hole aktuelle Map und Match-ID"""
-    try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_map",
-            timeout=10
-        )
-        response.raise_for_status()
-        result = response.json()
-        
-        data = result.get("result", result)
-        
-        current_map = None
-        if isinstance(data, dict):
-            current_map = (
-                data.get("id") or 
-                data.get("map") or 
-                data.get("name") or
-                data.get("map_name") or
-                data.get("layer") or
-                data.get("layer_name")
+class AsyncCrconClient:
+    """Nicht-blockierender CRCON-Client (aiohttp) mit Keep-Alive pro base_url.
+
+    Bietet dieselben get_*-Abfragen wie die synchronen Helfer, laeuft aber
+    vollstaendig auf dem Event-Loop, damit der Discord-Heartbeat nie blockiert.
+    """
+
+    def __init__(self, server: Dict):
+        self.server = server
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._breakers: Dict[str, Dict] = {}
+        # Optionale Endpoints mit erfolgreicher Antwort, deren Brauchbarkeit noch gemeldet wird
+        self._awaiting_verdict: set = set()
+        # endpoint -> (sha1 der Rohdaten, dekodiertes Ergebnis)
+        self._payloads: Dict[str, Tuple[str, object]] = {}
+        # endpoint -> Hash der zuletzt gelieferten Antwort (None = keine Antwort)
+        self._digests: Dict[str, Optional[str]] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Session erst im laufenden Event-Loop erzeugen (aiohttp-Vorgabe)
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(ssl=False, limit=self.server["http"]["pool_size"], keepalive_timeout=60)
+            # Neue Verbindungen zaehlen, um die Keep-Alive-Wiederverwendung zu sehen
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self._on_connection_created)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[trace],
+                headers={
+                    "Authorization": f"Bearer {API_TOKEN}",
+                    "Content-Type": "application/json"
+                }
             )
-        elif isinstance(data, str):
-            current_map = data
-        
-        if not current_map or current_map == "Unknown":
-            logger.warning(f"[{server['name']}] Konnte Map nicht extrahieren.")
-            current_map = "Unknown"
-        
-        match_id = current_map
-        return current_map, match_id
-    except Exception as e:
-        logger.error(f"Fehler beim Abrufen der Map von {server['name']}: {e}")
-        return "Unknown", None
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _on_connection_created(self, session, context, params):
+        self.server["http_stats"]["new_connections"] += 1
+
+    def _timeout(self, remaining: float) -> aiohttp.ClientTimeout:
+        http = self.server["http"]
+        return aiohttp.ClientTimeout(
+            total=remaining,
+            sock_connect=min(http["connect_timeout"], remaining),
+            sock_read=min(http["read_timeout"], remaining)
+        )
+
+    async def _request(self, method: str, endpoint: str, retry: Optional[bool] = None, budget: Optional[float] = None, **kwargs):
+        """JSON-Request mit Connect-/Read-Timeout, Gesamtbudget und Retry.
+
+        Wiederholt werden nur idempotente Abfragen (GET, oder retry=True) bei
+        Verbindungsfehlern, Timeouts, 5xx und 429 - mit exponentiellem Backoff,
+        solange das Zeitbudget reicht.
+        """
+        http = self.server["http"]
+        stats = self.server["http_stats"]
+        session = self._get_session()
+        if retry is None:
+            retry = method == "GET"
+        attempts = 1 + (http["retries"] if retry else 0)
+        deadline = time.monotonic() + (budget or http["budget"])
+        self._digests[endpoint] = None
+
+        for attempt in range(1, attempts + 1):
+            started = time.monotonic()
+            try:
+                async with session.request(
+                    method,
+                    f"{self.server['base_url']}/api/{endpoint}",
+                    timeout=self._timeout(deadline - started),
+                    **kwargs
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                # Nur parameterlose Abfragen sind pro Endpoint vergleichbar
+                return self._decode(endpoint, body) if not kwargs else json_loads(body)
+            except aiohttp.ClientResponseError as e:
+                if e.status < 500 and e.status != 429:
+                    raise
+                error = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            finally:
+                latency = time.monotonic() - started
+                stats["requests"] += 1
+                stats["latency_total"] += latency
+                stats["latency_max"] = max(stats["latency_max"], latency)
+                logger.debug(f"[{self.server['name']}] {method} {endpoint}: {latency * 1000:.0f}ms (Versuch {attempt}/{attempts})")
+
+            delay = HTTP_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            if attempt == attempts or deadline - time.monotonic() <= delay:
+                break
+            stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+        stats["failures"] += 1
+        raise error
+
+    def _decode(self, endpoint: str, body: bytes):
+        """JSON dekodieren; bei byte-identischer Antwort das vorherige Objekt liefern"""
+        digest = hashlib.sha1(body).hexdigest()
+        self._digests[endpoint] = digest
+        cached = self._payloads.get(endpoint)
+        if cached and cached[0] == digest:
+            return cached[1]
+        data = json_loads(body)
+        self._payloads[endpoint] = (digest, data)
+        return data
+
+    def payload_digest(self, endpoint: str) -> Optional[str]:
+        """Hash der letzten Antwort dieses Endpoints (None wenn keine geliefert wurde)"""
+        return self._digests.get(endpoint)
+
+    async def probe_status(self) -> bool:
+        """Guenstiger Lebenszeichen-Test ueber /api/get_status (kurzer Timeout)"""
+        try:
+            await self._request("GET", "get_status", retry=False, budget=INACTIVE_PROBE_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logger.debug(f"[{self.server['name']}] Status-Probe fehlgeschlagen: {e}")
+            return False
+
+    async def get_live_scoreboard(self):
+        """Hole Live-Scoreboard fuer aktuell verbundene Spieler"""
+        try:
+            data = await self._request("GET", "get_live_scoreboard")
+            # result kann Liste oder Dict sein
+            return data.get("result", [])
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen des Scoreboards von {self.server['name']}: {e}")
+            return None
+
+    def _breaker(self, endpoint: str) -> Dict:
+        return self._breakers.setdefault(endpoint, {
+            "failures": 0,
+            "open_until": 0.0,
+            "open_seconds": ENDPOINT_BREAKER_OPEN_SECONDS,
+            "half_open": False,
+        })
+
+    def endpoint_allowed(self, endpoint: str) -> bool:
+        """Circuit-Breaker: False solange ein optionaler Endpoint gesperrt ist."""
+        breaker = self._breaker(endpoint)
+        if not breaker["open_until"]:
+            return True
+        if time.monotonic() < breaker["open_until"]:
+            return False
+        if not breaker["half_open"]:
+            breaker["half_open"] = True
+            logger.info(f"[{self.server['name']}] Endpoint {endpoint}: Testabfrage (half-open)")
+        return True
+
+    def report_endpoint(self, endpoint: str, useful: bool):
+        """Ergebnis eines optionalen Endpoints melden (brauchbare Felder ja/nein).
+
+        Zaehlt einmal pro erfolgreicher Antwort; fehlgeschlagene Requests hat
+        _get_optional bereits gezaehlt, uebersprungene werden ignoriert.
+        """
+        if endpoint not in self._awaiting_verdict:
+            return
+        self._awaiting_verdict.discard(endpoint)
+        self._record_endpoint_result(endpoint, useful)
+
+    def _record_endpoint_result(self, endpoint: str, useful: bool):
+        breaker = self._breaker(endpoint)
+        if breaker["open_until"] and not breaker["half_open"]:
+            # Aufruf wurde uebersprungen, nichts zu bewerten
+            return
+        if useful:
+            if breaker["open_until"]:
+                logger.info(f"[{self.server['name']}] Endpoint {endpoint} wieder verfuegbar")
+            breaker.update(failures=0, open_until=0.0, open_seconds=ENDPOINT_BREAKER_OPEN_SECONDS, half_open=False)
+            return
+
+        breaker["failures"] += 1
+        if breaker["half_open"]:
+            breaker["open_seconds"] = min(breaker["open_seconds"] * 2, ENDPOINT_BREAKER_MAX_OPEN_SECONDS)
+        elif breaker["failures"] < ENDPOINT_BREAKER_THRESHOLD:
+            return
+        breaker["half_open"] = False
+        breaker["open_until"] = time.monotonic() + breaker["open_seconds"]
+        logger.warning(
+            f"[{self.server['name']}] Endpoint {endpoint} deaktiviert ({breaker['failures']} Fehlschlaege/"
+            f"ohne verwertbare Daten) - neuer Versuch in {breaker['open_seconds']}s"
+        )
+
+    async def _get_optional(self, endpoint: str, default, what: Optional[str]):
+        """GET auf einen optionalen Endpoint hinter dem Circuit-Breaker.
+
+        Fehler zaehlen sofort; ob eine erfolgreiche Antwort brauchbar war,
+        meldet der Aufrufer ueber report_endpoint().
+        """
+        if not self.endpoint_allowed(endpoint):
+            self._digests[endpoint] = None
+            return default
+        try:
+            data = await self._request("GET", endpoint)
+        except Exception as e:
+            if what:
+                logger.error(f"Fehler beim Abrufen {what} von {self.server['name']}: {e}")
+            self._awaiting_verdict.discard(endpoint)
+            self._record_endpoint_result(endpoint, False)
+            return default
+        self._awaiting_verdict.add(endpoint)
+        return data.get("result", default)
+
+    async def get_players(self):
+        """Hole Live-Players vom Server (enthaelt oft Support-Punkte)"""
+        return await self._get_optional("get_players", None, "der Players")
+
+    async def get_map_scoreboard(self):
+        """Hole Match-Scoreboard (Map) vom Server"""
+        return await self._get_optional("get_map_scoreboard", None, "des Map-Scoreboards")
+
+    async def get_live_game_stats(self) -> Dict:
+        """Hole Live-Game-Stats mit Timer und Score"""
+        return await self._get_optional("get_live_game_stats", {}, "der Live-Stats") or {}
+
+    async def get_gamestate(self) -> Dict:
+        """Hole aktuellen Gamestate (Fallback für Timer/Score)"""
+        return await self._get_optional("get_gamestate", {}, "des Gamestates") or {}
+
+    async def get_round_time_remaining(self) -> Optional[float]:
+        """Hole verbleibende Rundzeit in Sekunden (Fallback)."""
+        result = await self._get_optional("get_round_time_remaining", None, None)
+        try:
+            return float(result)
+        except (TypeError, ValueError):
+            return None
+
+    async def get_match_timer_and_score(self) -> Tuple[Optional[float], int, int]:
+        """Hole Timer und Score aus Live-Stats mit Fallbacks."""
+        return await resolve_match_timer_and_score(self.server, self)
+
+    async def get_current_map(self) -> Tuple[str, Optional[str]]:
+        """Hole aktuelle Map und Match-ID"""
+        try:
+            result = await self._request("GET", "get_map")
+            current_map = _extract_current_map(self.server, result)
+            match_id = current_map
+            return current_map, match_id
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der Map von {self.server['name']}: {e}")
+            return "Unknown", None
+
+    async def get_historical_logs(self, limit: int) -> Optional[List[Dict]]:
+        """Hole die letzten `limit` Log-Eintraege (neueste zuerst, None bei Fehler)"""
+        try:
+            data = await self._request("POST", "get_historical_logs", retry=True, json={"limit": limit})
+            return data.get("result", [])
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der Logs von {self.server['name']}: {e}")
+            return None
+
+    async def get_vip_ids(self) -> set:
+        """Hole alle Spieler-IDs mit VIP"""
+        try:
+            data = await self._request("GET", "get_vip_ids")
+            vips = data.get("result", [])
+            return {vip.get("player_id") for vip in vips if vip.get("player_id")}
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der VIP-Liste von {self.server['name']}: {e}")
+            return set()
+
+    async def message_player(self, player_id: str, player_name: str, message: str) -> str:
+        """Sende private Nachricht an Spieler (PM_OK / PM_RETRY / PM_FAILED)"""
+        payload = {
+            "player_id": player_id,
+            "message": message,
+            "by": "Top Killer VIP Bot",
+            "player_name": player_name
+        }
+        try:
+            session = self._get_session()
+            async with session.post(
+                f"{self.server['base_url']}/api/message_player",
+                json=payload,
+                timeout=self._timeout(self.server["http"]["budget"])
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"✓ PM gesendet an {player_name} ({player_id}) auf {self.server['name']}")
+                    return PM_OK
+                text = await response.text()
+                logger.warning(f"PM-Fehler für {player_name}: {response.status} - {text[:100]}")
+                # Nur Server-/Rate-Limit-Fehler sind voruebergehend
+                return PM_RETRY if response.status >= 500 or response.status == 429 else PM_FAILED
+        except Exception as e:
+            logger.error(f"Fehler beim Senden der PM an {player_name}: {e}")
+            return PM_RETRY
+
+    async def get_vip_index(self) -> Optional[Dict[str, Optional[datetime]]]:
+        """Hole VIP-Liste einmalig als Index player_id -> Expiration (None bei Fehler)"""
+        try:
+            data = await self._request("GET", "get_vip_ids")
+            return build_vip_index(data.get("result", []))
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der VIP-Liste von {self.server['name']}: {e}")
+            return None
+
+    async def get_vip_expiration(self, steam_id: str) -> Optional[str]:
+        """Hole VIP-Expiration fuer eine Spieler-ID."""
+        try:
+            data = await self._request("GET", "get_vip_ids")
+            for vip in data.get("result", []):
+                if vip.get("player_id") == steam_id:
+                    return vip.get("vip_expiration")
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der VIP-Daten von {self.server['name']}: {e}")
+        return None
+
+
+class CrconTickSnapshot:
+    """Memoisiert alle CRCON-Antworten eines Servers fuer genau einen Tick.
+
+    Jeder Endpoint wird pro Server und Tick hoechstens einmal abgefragt;
+    parallele Aufrufer teilen sich denselben laufenden Request.
+    """
+
+    def __init__(self, client: AsyncCrconClient):
+        self.client = client
+        self.server = client.server
+        self._results: Dict[str, asyncio.Future] = {}
+
+    async def _memo(self, key: str, factory):
+        future = self._results.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._results[key] = future
+        return await future
+
+    async def get_live_scoreboard(self):
+        return await self._memo("get_live_scoreboard", self.client.get_live_scoreboard)
+
+    async def get_players(self):
+        return await self._memo("get_players", self.client.get_players)
+
+    async def get_map_scoreboard(self):
+        return await self._memo("get_map_scoreboard", self.client.get_map_scoreboard)
+
+    async def get_live_game_stats(self) -> Dict:
+        return await self._memo("get_live_game_stats", self.client.get_live_game_stats)
+
+    async def get_gamestate(self) -> Dict:
+        return await self._memo("get_gamestate", self.client.get_gamestate)
+
+    async def get_round_time_remaining(self) -> Optional[float]:
+        return await self._memo("get_round_time_remaining", self.client.get_round_time_remaining)
+
+    async def get_current_map(self) -> Tuple[str, Optional[str]]:
+        return await self._memo("get_map", self.client.get_current_map)
+
+    async def get_vip_index(self, max_age: Optional[float] = None) -> Optional[Dict[str, Optional[datetime]]]:
+        key = "get_vip_ids" if max_age is None else f"get_vip_ids@{max_age}"
+        return await self._memo(key, lambda: get_cached_vip_index(self.server, max_age))
+
+    def report_endpoint(self, endpoint: str, useful: bool):
+        self.client.report_endpoint(endpoint, useful)
+
+    def payload_digest(self, endpoint: str) -> Optional[str]:
+        return self.client.payload_digest(endpoint)
+
+    async def get_match_timer_and_score(self) -> Tuple[Optional[float], int, int]:
+        return await self._memo(
+            "match_timer_and_score",
+            lambda: resolve_match_timer_and_score(self.server, self)
+        )
+
+
+SCOREBOARD_TEAM_KEYS = ("allied", "axis", "team1", "team2")
+PLAYER_ID_KEYS = ("player_id", "steam_id_64")
+PLAYER_NAME_KEYS = ("player", "name")
+SUPPORT_KEYS = (
+    "support", "support_points", "support_score", "score_support",
+    "supportScore", "supportPoints", "supp"
+)
+SUPPORT_SUBKEYS = ("score", "value", "total", "points")
+SCORE_BLOCK_KEYS = ("score", "scores")
+SCORE_BLOCK_SUPPORT_KEYS = ("support", "support_score", "support_points")
+SCHEMA_SAMPLE_SIZE = 5
+
+
+class ScoreboardRow(NamedTuple):
+    """Normalisierte, unveraenderliche Spielerzeile aus einem Scoreboard-Payload"""
+    steam_id: Optional[str]
+    name: str
+    kills: int
+    support: Optional[int]
+
+
+def _coerce_support(value) -> Optional[int]:
+    """Support-Wert (Zahl, String oder Dict mit score/value/...) nach int"""
+    try:
+        if isinstance(value, dict):
+            for subkey in SUPPORT_SUBKEYS:
+                if value.get(subkey) is not None:
+                    return int(value[subkey])
+            return None
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _detect_support_path(samples: List[Dict]) -> Tuple[str, ...]:
+    """Support-Feld anhand einiger Spieler bestimmen: (key,) oder (score-block, key)"""
+    blocks = {
+        block_key: [p[block_key] for p in samples if isinstance(p.get(block_key), dict)]
+        for block_key in SCORE_BLOCK_KEYS
+    }
+    # Zuerst Felder mit Wert, dann Felder die nur vorhanden sind (Wert noch None)
+    for present in (lambda d, k: d.get(k) is not None, lambda d, k: k in d):
+        for key in SUPPORT_KEYS:
+            if any(present(p, key) for p in samples):
+                return (key,)
+        for block_key, block_list in blocks.items():
+            for key in SCORE_BLOCK_SUPPORT_KEYS:
+                if any(present(b, key) for b in block_list):
+                    return (block_key, key)
+    return ()
+
+
+def _compile_row_extractor(support_path: Tuple[str, ...]):
+    """Zeilen-Extraktor fuer ein festes Support-Layout bauen (kein Key-Probing pro Spieler).
+
+    ID und Name behalten den Fallback pro Zeile (player_id/steam_id_64,
+    player/name), damit Zeilen mit leerem Haupt-Key nicht verloren gehen.
+    """
+    id_key, alt_id_key = PLAYER_ID_KEYS
+    name_key, alt_name_key = PLAYER_NAME_KEYS
+    if len(support_path) == 1:
+        support_key = support_path[0]
+
+        def support_of(player):
+            value = player.get(support_key)
+            return None if value is None else _coerce_support(value)
+    elif len(support_path) == 2:
+        block_key, support_key = support_path
+
+        def support_of(player):
+            block = player.get(block_key)
+            if not isinstance(block, dict) or block.get(support_key) is None:
+                return None
+            return _coerce_support(block[support_key])
+    else:
+        def support_of(player):
+            return None
+
+    def row(player: Dict, steam_id: Optional[str] = None) -> ScoreboardRow:
+        if steam_id is None:
+            steam_id = player.get(id_key) or player.get(alt_id_key)
+        if steam_id == "None":
+            steam_id = None
+        name = player.get(name_key) or player.get(alt_name_key) or "Unknown"
+        return ScoreboardRow(steam_id or None, name, player.get("kills") or 0, support_of(player))
+
+    return row
+
+
+class ScoreboardSchema:
+    """Einmal erkanntes Layout eines Scoreboard-Payloads samt kompiliertem Extraktor.
+
+    Wird pro Server und Endpoint gecacht und erst neu erkannt, wenn sich
+    Container oder Feldnamen im Payload aendern.
+    """
+
+    __slots__ = ("layout", "containers", "keys", "id_key", "name_key", "support_path", "row")
+
+    def __init__(self, layout: str, containers: Tuple[str, ...], samples: List[Dict]):
+        self.layout = layout
+        self.containers = containers
+        self.keys = frozenset(samples[0]) if samples else frozenset()
+        self.id_key = next((key for key in PLAYER_ID_KEYS if key in self.keys), None)
+        self.name_key = next((key for key in PLAYER_NAME_KEYS if key in self.keys), None)
+        self.support_path = _detect_support_path(samples)
+        self.row = _compile_row_extractor(self.support_path)
+
+    def matches(self, layout: str, containers: Tuple[str, ...], first_player: Dict) -> bool:
+        return layout == self.layout and containers == self.containers and first_player.keys() == self.keys
+
+    def describe(self) -> str:
+        where = "/".join(self.containers) or self.layout
+        support = ".".join(self.support_path) or "-"
+        return f"{where} | id={self.id_key} name={self.name_key} support={support}"
+
+
+def _detect_scoreboard_layout(scoreboard) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """Container der Spielerliste bestimmen (Team-Keys > stats > players > Dict mit steam_id)"""
+    if isinstance(scoreboard, dict):
+        teams = tuple(key for key in SCOREBOARD_TEAM_KEYS if isinstance(scoreboard.get(key), list))
+        if any(isinstance(p, dict) for key in teams for p in scoreboard[key]):
+            return "containers", teams
+        for key in ("stats", "players"):
+            items = scoreboard.get(key)
+            if isinstance(items, list) and any(isinstance(p, dict) for p in items):
+                return "containers", (key,)
+        return "by_id", ()
+    if isinstance(scoreboard, list):
+        return "list", ()
+    return None, ()
+
+
+def _scoreboard_entries(scoreboard, layout: Optional[str], containers: Tuple[str, ...]) -> List[Tuple[Optional[str], Dict]]:
+    """(steam_id aus dem Dict-Key oder None, Spieler-Dict) - ohne den Payload zu veraendern"""
+    if layout == "containers":
+        return [(None, p) for key in containers for p in scoreboard[key] if isinstance(p, dict)]
+    if layout == "list":
+        return [(None, p) for p in scoreboard if isinstance(p, dict)]
+    if layout == "by_id":
+        entries = []
+        for steam_id, data in scoreboard.items():
+            if isinstance(data, dict):
+                entries.append((steam_id, data))
+            elif isinstance(data, list):
+                entries.extend((None, p) for p in data if isinstance(p, dict))
+        return entries
+    return []
+
+
+def extract_scoreboard_players(scoreboard, schemas: Optional[Dict[str, ScoreboardSchema]] = None, endpoint: str = "") -> List[ScoreboardRow]:
+    """Spielerzeilen aus unterschiedlichen Scoreboard-Formaten extrahieren.
+
+    Mit `schemas` (Cache pro Server) wird das Layout je Endpoint nur bei
+    Aenderungen neu erkannt. Der Payload wird nicht veraendert.
+    """
+    layout, containers = _detect_scoreboard_layout(scoreboard)
+    entries = _scoreboard_entries(scoreboard, layout, containers)
+    if not entries:
+        return []
+
+    schema = schemas.get(endpoint) if schemas is not None else None
+    if schema is None or not schema.matches(layout, containers, entries[0][1]):
+        schema = ScoreboardSchema(layout, containers, [p for _, p in entries[:SCHEMA_SAMPLE_SIZE]])
+        if schemas is not None:
+            schemas[endpoint] = schema
+            logger.debug(f"Scoreboard-Schema fuer {endpoint} erkannt: {schema.describe()}")
+
+    row = schema.row
+    return [row(player, steam_id) for steam_id, player in entries]
 
 
 def get_vip_ids(server) -> set:
     """Hole alle Spieler-IDs mit VIP"""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_vip_ids",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_vip_ids")
         response.raise_for_status()
-        vips = response.json().get("result", [])
+        vips = json_loads(response.content).get("result", [])
         return {vip.get("player_id") for vip in vips if vip.get("player_id")}
     except Exception as e:
         logger.error(f"Fehler beim Abrufen der VIP-Liste von {server['name']}: {e}")
@@ -550,12 +1328,9 @@ def get_vip_ids(server) -> set:
 def get_vip_expiration(server, steam_id: str) -> Optional[str]:
     """Hole VIP-Expiration fuer eine Spieler-ID."""
     try:
-        response = server["session"].get(
-            f"{server['base_url']}/api/get_vip_ids",
-            timeout=10
-        )
+        response = crcon_request(server, "GET", "get_vip_ids")
         response.raise_for_status()
-        vips = response.json().get("result", [])
+        vips = json_loads(response.content).get("result", [])
         for vip in vips:
             if vip.get("player_id") == steam_id:
                 return vip.get("vip_expiration")
@@ -592,59 +1367,150 @@ def parse_vip_expiration(expiration: str) -> datetime:
             return datetime.now(timezone.utc)
 
 
-def _compute_award_expiration(server, steam_id: str, hours: int) -> Optional[datetime]:
-    current_exp = get_vip_expiration(server, steam_id)
-    if is_lifetime_vip(current_exp):
+# Platzhalter-Expiration fuer Lifetime-VIPs im VIP-Index
+VIP_LIFETIME = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def parse_vip_index_entry(expiration: Optional[str]) -> Optional[datetime]:
+    if not expiration:
         return None
-    if current_exp:
-        base_time = parse_vip_expiration(current_exp)
+    if is_lifetime_vip(expiration):
+        return VIP_LIFETIME
+    parsed = parse_vip_expiration(str(expiration))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _is_lifetime_expiration(expiration: Optional[datetime]) -> bool:
+    return expiration is not None and expiration.year >= 3000
+
+
+def build_vip_index(vips: List[Dict]) -> Dict[str, Optional[datetime]]:
+    """VIP-Liste einmal parsen: player_id -> Expiration (None = ohne Ablaufdatum)"""
+    index: Dict[str, Optional[datetime]] = {}
+    for vip in vips:
+        if not isinstance(vip, dict) or not vip.get("player_id"):
+            continue
+        index[vip["player_id"]] = parse_vip_index_entry(vip.get("vip_expiration"))
+    return index
+
+
+def _vip_cache(server) -> Dict:
+    return server.setdefault("vip_cache", {"index": None, "fetched_at": 0.0, "hits": 0, "misses": 0})
+
+
+async def get_cached_vip_index(
+    server,
+    max_age: Optional[float] = None,
+    fetched_after: Optional[float] = None
+) -> Optional[Dict[str, Optional[datetime]]]:
+    """VIP-Index mit TTL-Cache pro Server.
+
+    add_vip_hours aktualisiert den gecachten Index direkt (write-through).
+    VIPs koennen aber auch von Admins, Shops oder dem Legacy-Script
+    vergeben werden - vor einer Vergabe daher mit max_age=0 frisch laden
+    oder mit fetched_after einen Stand verlangen, der nach diesem
+    Zeitpunkt (time.monotonic) geladen wurde.
+    """
+    cache = _vip_cache(server)
+    ttl = VIP_CACHE_TTL_SECONDS if max_age is None else max_age
+    if fetched_after is not None:
+        fresh_enough = cache["fetched_at"] >= fetched_after
     else:
-        base_time = datetime.now(timezone.utc)
+        fresh_enough = (time.monotonic() - cache["fetched_at"]) < ttl
+    if cache["index"] is not None and fresh_enough:
+        cache["hits"] += 1
+        return cache["index"]
+
+    cache["misses"] += 1
+    # Parallele Aufrufer (z.B. Award-Worker) teilen sich denselben Abruf
+    loading = cache.get("loading")
+    if loading is None:
+        loading = asyncio.ensure_future(server["client"].get_vip_index())
+        cache["loading"] = loading
+    index = await loading
+    if cache.get("loading") is loading:
+        cache["loading"] = None
+    if index is None:
+        # Fuer reine Anzeige lieber veraltete Daten als gar keine; wer frische
+        # Daten verlangt (Vergabe), bekommt None und muss spaeter erneut versuchen
+        return cache["index"] if max_age is None and fetched_after is None else None
+    cache["index"] = index
+    cache["fetched_at"] = time.monotonic()
+    return index
+
+
+def _compute_award_expiration(current_exp: Optional[datetime], hours: int) -> Optional[datetime]:
+    if _is_lifetime_expiration(current_exp):
+        return None
+    base_time = current_exp or datetime.now(timezone.utc)
     return base_time + timedelta(hours=hours)
 
 
-def add_vip_hours(server, steam_id: str, player_name: str, hours: int) -> bool:
-    """FÃ¼ge VIP mit angegebenen Stunden hinzu"""
+def add_vip_hours(
+    server,
+    steam_id: str,
+    player_name: str,
+    hours: int,
+    vip_index: Optional[Dict[str, Optional[datetime]]] = None,
+    expiration: Optional[datetime] = None
+) -> bool:
+    """FÃ¼ge VIP mit angegebenen Stunden hinzu
+
+    Mit ``vip_index`` (siehe build_vip_index) wird die aktuelle Expiration
+    lokal gelesen statt die komplette VIP-Liste erneut abzurufen. Eine feste
+    ``expiration`` ersetzt die Berechnung aus aktueller Expiration + hours.
+    """
     try:
-        current_exp = get_vip_expiration(server, steam_id)
-        if is_lifetime_vip(current_exp):
+        if vip_index is None:
+            vip_index = {}
+            raw_exp = get_vip_expiration(server, steam_id)
+            if raw_exp:
+                vip_index[steam_id] = parse_vip_index_entry(raw_exp)
+
+        current_exp = vip_index.get(steam_id)
+        if _is_lifetime_expiration(current_exp):
             logger.info(
                 f"[{server['name']}] Lifetime VIP erkannt fuer {player_name} ({steam_id}) - keine Aenderung."
             )
             return True
 
+        if expiration is not None and current_exp is not None and expiration <= current_exp:
+            # Nie eine fruehere Expiration schreiben (VIP wurde inzwischen anderweitig verlaengert)
+            logger.info(
+                f"[{server['name']}] VIP von {player_name} ({steam_id}) laeuft bereits bis {current_exp.isoformat()} "
+                f"- Ziel {expiration.isoformat()} wuerde verkuerzen, keine Aenderung."
+            )
+            return True
+
         if current_exp:
             remove_payload = {"player_id": steam_id}
-            remove_response = server["session"].post(
-                f"{server['base_url']}/api/remove_vip",
-                json=remove_payload,
-                timeout=10
-            )
+            remove_response = crcon_request(server, "POST", "remove_vip", json=remove_payload)
             if remove_response.status_code != 200:
                 logger.warning(
                     f"[{server['name']}] Entfernen von VIP fehlgeschlagen fuer {player_name}: "
                     f"{remove_response.status_code} - {remove_response.text[:200]}"
                 )
+            else:
+                vip_index.pop(steam_id, None)
 
-            base_time = parse_vip_expiration(current_exp)
+            base_time = current_exp
         else:
             base_time = datetime.now(timezone.utc)
 
-        expiration = (base_time + timedelta(hours=hours)).isoformat().replace("+00:00", "Z")
+        new_expiration = expiration or (base_time + timedelta(hours=hours))
         
         payload = {
             "player_id": steam_id,
-            "expiration": expiration,
+            "expiration": new_expiration.isoformat().replace("+00:00", "Z"),
             "description": f"Top Killer Belohnung (+{hours}h)"
         }
         
-        response = server["session"].post(
-            f"{server['base_url']}/api/add_vip",
-            json=payload,
-            timeout=10
-        )
+        response = crcon_request(server, "POST", "add_vip", json=payload)
         
         if response.status_code == 200:
+            vip_index[steam_id] = new_expiration
             logger.info(f"âœ“ VIP (+{hours}h) vergeben an {player_name} ({steam_id}) auf {server['name']}")
             return True
         else:
@@ -660,57 +1526,561 @@ async def _run_blocking(func, *args, **kwargs):
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
-def send_private_message(server, player_id: str, player_name: str, message: str) -> bool:
-    """Sende private Nachricht an Spieler"""
-    try:
-        payload = {
-            "player_id": player_id,
-            "message": message,
-            "by": "Top Killer VIP Bot",
-            "player_name": player_name
+class PmDispatcher:
+    """PM-Versand pro Server mit begrenzter Parallelitaet und Retry/Backoff.
+
+    send_batch reiht Nachrichten nur ein und kehrt sofort zurueck, damit die
+    Match-Ende-Verarbeitung nie auf message_player warten muss.
+    """
+
+    def __init__(self, server: Dict):
+        self.server = server
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._retry_tasks: set = set()
+
+    def _ensure_started(self):
+        if not self._workers:
+            self._queue = asyncio.Queue()
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(PM_CONCURRENCY)]
+
+    def send_batch(self, messages: List[Tuple[str, str, str]]):
+        """Nachrichten (player_id, player_name, message) zum Versand einreihen"""
+        if not messages:
+            return
+        self._ensure_started()
+        for player_id, player_name, message in messages:
+            logger.info(f"[{self.server['name']}] 📨 PM eingereiht fuer {player_name} ({player_id})")
+            self._queue.put_nowait((player_id, player_name, message, 0))
+
+    async def stop(self):
+        tasks_to_cancel = self._workers + list(self._retry_tasks)
+        for task in tasks_to_cancel:
+            task.cancel()
+        await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
+        self._workers = []
+        self._retry_tasks.clear()
+
+    async def _requeue_after(self, item: Tuple, delay: float):
+        await asyncio.sleep(delay)
+        self._queue.put_nowait(item)
+
+    def _requeue_later(self, item: Tuple, delay: float):
+        # Task-Referenz halten, damit der Retry nicht vom GC eingesammelt wird
+        task = asyncio.create_task(self._requeue_after(item, delay))
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def _worker(self):
+        while True:
+            player_id, player_name, message, attempt = await self._queue.get()
+            try:
+                result = await self.server["client"].message_player(player_id, player_name, message)
+                if result == PM_RETRY and attempt + 1 < PM_MAX_ATTEMPTS:
+                    delay = PM_RETRY_DELAY_SECONDS * (2 ** attempt)
+                    self._requeue_later((player_id, player_name, message, attempt + 1), delay)
+                elif result != PM_OK:
+                    logger.warning(f"[{self.server['name']}] ⚠️ PM konnte nicht gesendet werden an {player_name} (möglicherweise disconnected)")
+            except Exception as e:
+                logger.error(f"[{self.server['name']}] Fehler im PM-Worker: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+
+def _pm_dispatcher(server) -> PmDispatcher:
+    dispatcher = server.get("pm_dispatcher")
+    if dispatcher is None:
+        dispatcher = server["pm_dispatcher"] = PmDispatcher(server)
+    return dispatcher
+
+
+def _match_key(state: Dict) -> str:
+    """Eindeutiger Match-Schluessel (Map allein wiederholt sich)"""
+    match_start = state.get("match_start")
+    started = int(match_start.timestamp()) if match_start else 0
+    return f"{state.get('current_match_id')}@{started}"
+
+
+def _job_key(match_key: str, steam_id: str, base_url: str) -> str:
+    return f"{match_key}|{steam_id}|{base_url}"
+
+
+class AwardPipeline:
+    """VIP-Vergabe im Hintergrund mit persistentem Idempotenz-Journal.
+
+    Jeder Job ist ueber (match_key, steam_id, server) eindeutig. Vor dem
+    add_vip-Aufruf wird die Ziel-Expiration im Journal festgeschrieben; nach
+    einem Neustart wird ein Job als erledigt erkannt, sobald die VIP-Liste
+    diese Expiration bereits enthaelt. So wird weder doppelt noch gar nicht
+    vergeben.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.jobs: Dict[str, Dict] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._events: Dict[str, asyncio.Event] = {}
+        self._workers: List[asyncio.Task] = []
+        # Referenzen auf Retry-Tasks halten, sonst kann der GC sie mitten im sleep einsammeln
+        self._retry_tasks: set = set()
+        self._save_lock = asyncio.Lock()
+        # Jobs desselben Spielers auf demselben Server (aus verschiedenen Matches) nie parallel
+        self._player_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # Zeitpunkt des VIP-Abrufs bei Match-Ende je Job (nur im Speicher; nach Neustart frisch laden)
+        self._vip_snapshots: Dict[str, float] = {}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                self.jobs = json_loads(f.read())
+        except Exception as e:
+            logger.error(f"Fehler beim Laden von {self.path}: {e}")
+            return
+
+        # Abgeschlossene Jobs nach Ablauf der Aufbewahrungszeit verwerfen
+        cutoff = datetime.now(timezone.utc) - timedelta(days=AWARD_JOURNAL_RETENTION_DAYS)
+        self.jobs = {
+            key: job for key, job in self.jobs.items()
+            if job.get("status") not in ("done", "failed")
+            or (_parse_datetime(job.get("created_at")) or cutoff) > cutoff
         }
-        response = server["session"].post(
-            f"{server['base_url']}/api/message_player",
-            json=payload,
-            timeout=10
+        pending = sum(1 for job in self.jobs.values() if job.get("status") not in ("done", "failed"))
+        logger.info(f"✓ Award-Journal geladen ({len(self.jobs)} Jobs, {pending} offen)")
+
+    async def _save(self):
+        """Journal atomar im Hintergrund-Thread schreiben; Fehler gehen an den Aufrufer"""
+        async with self._save_lock:
+            # Momentaufnahme unter dem Lock, damit Schreibvorgaenge in Reihenfolge bleiben
+            data = json_dumps(self.jobs)
+            try:
+                await _run_blocking(_write_file_atomic, self.path, data)
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern von {self.path}: {e}")
+                raise
+
+    def _event(self, key: str) -> asyncio.Event:
+        event = self._events.get(key)
+        if event is None:
+            event = asyncio.Event()
+            if self.jobs.get(key, {}).get("status") in ("done", "failed"):
+                event.set()
+            self._events[key] = event
+        return event
+
+    async def start(self):
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(AWARD_WORKERS)]
+        # Offene Jobs aus dem Journal (z.B. nach Absturz) wieder einreihen
+        for key, job in self.jobs.items():
+            if job.get("status") not in ("done", "failed"):
+                self._queue.put_nowait(key)
+
+    async def stop(self):
+        tasks_to_cancel = self._workers + list(self._retry_tasks)
+        for task in tasks_to_cancel:
+            task.cancel()
+        await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
+        self._workers = []
+        self._retry_tasks.clear()
+
+    async def enqueue(
+        self,
+        match_key: str,
+        origin_server,
+        steam_id: str,
+        player_name: str,
+        rank: int,
+        kills: int,
+        hours: int,
+        vip_snapshot_at: Optional[float] = None
+    ) -> List[str]:
+        """Lege je Ziel-Server einen Job an; bereits bekannte Jobs bleiben unveraendert.
+
+        Die Jobs werden erst eingereiht, wenn das Journal geschrieben ist;
+        ein Schreibfehler wird weitergereicht (Match dann nicht als belohnt markieren).
+        vip_snapshot_at: Zeitpunkt des frischen VIP-Abrufs bei Match-Ende -
+        die Jobs verwenden diesen Stand statt erneut zu laden.
+        """
+        keys = []
+        created = []
+        created_at = _serialize_datetime(datetime.now(timezone.utc))
+        for target_server in servers:
+            key = _job_key(match_key, steam_id, target_server["base_url"])
+            keys.append(key)
+            if key in self.jobs:
+                continue
+            self.jobs[key] = {
+                "match_key": match_key,
+                "steam_id": steam_id,
+                "player_name": player_name,
+                "base_url": target_server["base_url"],
+                "origin": origin_server["base_url"],
+                "rank": rank,
+                "kills": kills,
+                "hours": hours,
+                "status": "pending",
+                "attempts": 0,
+                "expiration": None,
+                "pm_sent": False,
+                "created_at": created_at
+            }
+            created.append(key)
+        if created:
+            try:
+                await self._save()
+            except Exception:
+                for key in created:
+                    self.jobs.pop(key, None)
+                raise
+            if vip_snapshot_at is not None:
+                for key in created:
+                    self._vip_snapshots[key] = vip_snapshot_at
+            if self._queue is not None:
+                for key in created:
+                    self._queue.put_nowait(key)
+        return keys
+
+    async def wait_for(self, keys: List[str]):
+        await asyncio.gather(*[self._event(key).wait() for key in keys])
+
+    def group_success(self, match_key: str, steam_id: str) -> Optional[bool]:
+        """True/False wenn alle Server-Jobs eines Spielers fertig sind, sonst None."""
+        group = [
+            job for job in self.jobs.values()
+            if job["match_key"] == match_key and job["steam_id"] == steam_id
+        ]
+        if not group or any(job["status"] not in ("done", "failed") for job in group):
+            return None
+        return all(job["status"] == "done" for job in group)
+
+    async def _worker(self):
+        while True:
+            key = await self._queue.get()
+            try:
+                await self._run_job(key)
+            except Exception as e:
+                logger.error(f"Fehler im Award-Worker fuer {key}: {e}", exc_info=True)
+                # z.B. Journal nicht schreibbar - offene Jobs spaeter erneut versuchen
+                if self.jobs.get(key, {}).get("status") not in (None, "done", "failed"):
+                    self._requeue_later(key, AWARD_RETRY_DELAY_SECONDS)
+            finally:
+                self._queue.task_done()
+
+    async def _requeue_after(self, key: str, delay: float):
+        await asyncio.sleep(delay)
+        self._queue.put_nowait(key)
+
+    def _requeue_later(self, key: str, delay: float):
+        task = asyncio.create_task(self._requeue_after(key, delay))
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def _finish(self, key: str, status: str):
+        self.jobs[key]["status"] = status
+        self._vip_snapshots.pop(key, None)
+        try:
+            await self._save()
+        finally:
+            self._event(key).set()
+
+    async def _run_job(self, key: str):
+        job = self.jobs.get(key)
+        if not job or job["status"] in ("done", "failed"):
+            return
+
+        player_key = (job["steam_id"], job["base_url"])
+        lock = self._player_locks.setdefault(player_key, asyncio.Lock())
+        try:
+            async with lock:
+                await self._run_job_locked(key)
+        finally:
+            if not lock.locked() and not self._has_open_jobs(player_key):
+                self._player_locks.pop(player_key, None)
+
+    def _has_open_jobs(self, player_key: Tuple[str, str], exclude: Optional[str] = None, pinned_only: bool = False) -> bool:
+        return any(
+            other_key != exclude
+            and (job["steam_id"], job["base_url"]) == player_key
+            and job["status"] not in ("done", "failed")
+            and (not pinned_only or job["expiration"] is not None)
+            for other_key, job in self.jobs.items()
         )
-        
-        if response.status_code == 200:
-            logger.info(f"✓ PM gesendet an {player_name} ({player_id}) auf {server['name']}")
-            return True
+
+    async def _run_job_locked(self, key: str):
+        job = self.jobs.get(key)
+        if not job or job["status"] in ("done", "failed"):
+            return
+
+        server = next((s for s in servers if s["base_url"] == job["base_url"]), None)
+        if server is None:
+            logger.warning(f"Award-Job {key}: Server nicht mehr konfiguriert - verworfen")
+            await self._finish(key, "failed")
+            return
+
+        steam_id = job["steam_id"]
+        if job["expiration"] is None and self._has_open_jobs((steam_id, job["base_url"]), exclude=key, pinned_only=True):
+            # Ein anderer Job hat sein Ziel schon festgelegt, aber noch nicht geschrieben -
+            # erst danach rechnen, sonst landen beide auf derselben Expiration
+            self._requeue_later(key, AWARD_RETRY_DELAY_SECONDS)
+            return
+
+        # Erster Durchlauf legt die Ziel-Expiration fest -> frischer VIP-Stand noetig
+        # (Stand vom Match-Ende genuegt; ohne ihn, z.B. nach Neustart, neu laden)
+        if job["expiration"] is None:
+            snapshot_at = self._vip_snapshots.get(key)
+            if snapshot_at is not None:
+                vip_index = await get_cached_vip_index(server, fetched_after=snapshot_at)
+            else:
+                vip_index = await get_cached_vip_index(server, max_age=0)
         else:
-            logger.warning(f"PM-Fehler für {player_name}: {response.status_code} - {response.text[:100]}")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Fehler beim Senden der PM an {player_name}: {e}")
-        return False
+            vip_index = await get_cached_vip_index(server)
+        current_exp = (vip_index or {}).get(steam_id)
+
+        if job["expiration"] is None and vip_index is None:
+            # Ohne aktuelle VIP-Liste keine Ziel-Expiration festlegen (wuerde bestehende VIPs verkuerzen)
+            logger.warning(
+                f"[{server['name']}] VIP-Liste nicht abrufbar - Job {key} bleibt offen, "
+                f"neuer Versuch in {AWARD_RETRY_DELAY_SECONDS}s"
+            )
+            self._requeue_later(key, AWARD_RETRY_DELAY_SECONDS)
+            return
+
+        if job["expiration"] is None:
+            if _is_lifetime_expiration(current_exp):
+                logger.info(f"[{server['name']}] Lifetime VIP erkannt fuer {job['player_name']} ({steam_id}) - keine Aenderung.")
+                await self._finish(key, "done")
+                await self._notify_player(job)
+                return
+            # Ziel-Expiration festschreiben, bevor CRCON veraendert wird
+            job["expiration"] = _serialize_datetime(_compute_award_expiration(current_exp, job["hours"]))
+            job["status"] = "in_progress"
+            try:
+                await self._save()
+            except Exception:
+                # Ohne festgeschriebene Ziel-Expiration kein add_vip (Idempotenz nach Neustart)
+                job["expiration"] = None
+                job["status"] = "pending"
+                raise
+        elif current_exp is not None and current_exp >= _parse_datetime(job["expiration"]):
+            logger.info(f"[{server['name']}] VIP fuer {job['player_name']} ({steam_id}) bereits vergeben - Job {key} uebersprungen")
+            await self._finish(key, "done")
+            await self._notify_player(job)
+            return
+
+        success = await _run_blocking(
+            add_vip_hours, server, steam_id, job["player_name"], job["hours"], vip_index,
+            expiration=_parse_datetime(job["expiration"])
+        )
+        job["attempts"] += 1
+
+        if success:
+            await self._finish(key, "done")
+        elif job["attempts"] >= AWARD_MAX_ATTEMPTS:
+            logger.error(f"[{server['name']}] VIP-Vergabe an {job['player_name']} nach {job['attempts']} Versuchen aufgegeben")
+            await self._finish(key, "failed")
+        else:
+            delay = AWARD_RETRY_DELAY_SECONDS * (2 ** (job["attempts"] - 1))
+            logger.warning(f"[{server['name']}] VIP-Vergabe an {job['player_name']} fehlgeschlagen - neuer Versuch in {delay}s")
+            await self._save()
+            self._requeue_later(key, delay)
+            return
+
+        await self._notify_player(job)
 
+    async def _notify_player(self, job: Dict):
+        """PM an den Spieler, sobald alle Server-Jobs erfolgreich abgeschlossen sind."""
+        match_key, steam_id = job["match_key"], job["steam_id"]
+        if not self.group_success(match_key, steam_id):
+            return
+        group = [j for j in self.jobs.values() if j["match_key"] == match_key and j["steam_id"] == steam_id]
+        if any(j["pm_sent"] for j in group):
+            return
+        for j in group:
+            j["pm_sent"] = True
+        await self._save()
+
+        origin = next((s for s in servers if s["base_url"] == job["origin"]), None)
+        if origin is None:
+            return
+        origin_job = next((j for j in group if j["base_url"] == job["origin"]), job)
+        expiration_dt = _parse_datetime(origin_job.get("expiration"))
+        expiration_text = (
+            expiration_dt.strftime("%Y-%m-%d %H:%M UTC") if expiration_dt else "unknown time"
+        )
+        pm_message = (
+            "🏆 CONGRATULATIONS! 🏆\n"
+            f"You placed Top Killer #{job['rank']} with {job['kills']} kills. "
+            f"Your VIP has been extended until {expiration_text}."
+        )
+        logger.info(f"[{origin['name']}] 📨 Sende PM an Top Killer #{job['rank']}: {job['player_name']} ({steam_id})")
+        _pm_dispatcher(origin).send_batch([(steam_id, job["player_name"], pm_message)])
+
+
+award_pipeline = AwardPipeline(AWARD_JOURNAL_FILE)
+
+
+DISCORD_PRIORITY_FINAL = 0
+DISCORD_PRIORITY_NOTICE = 1
+DISCORD_PRIORITY_LIVE = 2
+
+
+class DiscordWriteScheduler:
+    """Zentrale Warteschlange fuer alle Discord-Schreibzugriffe auf den Channel.
+
+    Haelt das Channel-Bucket (DISCORD_WRITES_PER_WINDOW pro
+    DISCORD_WRITE_WINDOW_SECONDS) ein, bedient finale/Freeze-Nachrichten vor
+    Live-Edits und ersetzt wartende Live-Edits eines Servers durch den neuesten.
+    """
+
+    def __init__(self, max_writes: int, window: float):
+        self.max_writes = max_writes
+        self.window = window
+        self._sent = deque()
+        self._heap: List[Tuple[int, int]] = []
+        self._items: Dict[int, Tuple[object, asyncio.Future, Optional[str]]] = {}
+        self._pending_by_key: Dict[str, int] = {}
+        self._seq = 0
+        self._blocked_until = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _ensure_started(self):
+        if self._worker is None:
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.create_task(self._run())
+
+    def submit(self, priority: int, factory, key: Optional[str] = None) -> asyncio.Future:
+        """Schreibzugriff einreihen; ``factory`` liefert die auszufuehrende Coroutine.
+
+        Mit ``key`` ersetzt ein neuer Auftrag einen noch wartenden mit demselben Key
+        (dessen Future liefert dann None).
+        """
+        self._ensure_started()
+        if key is not None:
+            self.drop(key)
+        future = asyncio.get_running_loop().create_future()
+        self._seq += 1
+        heapq.heappush(self._heap, (priority, self._seq))
+        self._items[self._seq] = (factory, future, key)
+        if key is not None:
+            self._pending_by_key[key] = self._seq
+        self._wakeup.set()
+        return future
+
+    def drop(self, key: str):
+        """Wartenden Auftrag mit diesem Key verwerfen (z.B. veralteter Live-Edit)"""
+        seq = self._pending_by_key.pop(key, None)
+        if seq is None:
+            return
+        item = self._items.pop(seq, None)
+        if item is not None and not item[1].done():
+            item[1].set_result(None)
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    async def _acquire_slot(self):
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            while self._sent and now - self._sent[0] >= self.window:
+                self._sent.popleft()
+            if len(self._sent) < self.max_writes:
+                return
+            await asyncio.sleep(self.window - (now - self._sent[0]))
+
+    async def _run(self):
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # Erst auf einen freien Slot warten, dann den wichtigsten Auftrag waehlen
+            await self._acquire_slot()
+            _, seq = heapq.heappop(self._heap)
+            item = self._items.pop(seq, None)
+            if item is None:
+                continue
+            factory, future, key = item
+            if key is not None and self._pending_by_key.get(key) == seq:
+                del self._pending_by_key[key]
+
+            self._sent.append(time.monotonic())
+            try:
+                result = await factory()
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if _is_rate_limited(e):
+                    retry_after = float(getattr(e, "retry_after", None) or self.window)
+                    self._blocked_until = time.monotonic() + retry_after
+                    logger.warning(f"Discord Rate-Limit erreicht - pausiere Schreibzugriffe fuer {retry_after:.1f}s")
+                if not future.done():
+                    future.set_exception(e)
+
+
+discord_scheduler = DiscordWriteScheduler(DISCORD_WRITES_PER_WINDOW, DISCORD_WRITE_WINDOW_SECONDS)
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    return isinstance(error, discord.HTTPException) and error.status == 429
+
+
+def _consume_write_result(future: asyncio.Future):
+    """Ergebnis nicht abgewarteter Schreibzugriffe abholen (sonst "Future exception was never retrieved")"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    # 429 protokolliert bereits der Scheduler (inkl. Pause)
+    if error is not None and not _is_rate_limited(error):
+        logger.error(f"Discord-Schreibzugriff fehlgeschlagen: {error}")
 
-def create_live_embed(server, state: Dict, current_map: str) -> discord.Embed:
+
+def _timer_display_bucket(timer_remaining: float) -> float:
+    """Timer fuer die Anzeige vergroebern; ab der 90s-Phase sekundengenau"""
+    if timer_remaining <= 90:
+        return timer_remaining
+    return (timer_remaining // LIVE_TIMER_BUCKET_SECONDS) * LIVE_TIMER_BUCKET_SECONDS
+
+
+def _embed_fingerprint(embed: discord.Embed) -> str:
+    """Hash ueber den sichtbaren Embed-Inhalt (ohne Timestamp)"""
+    data = embed.to_dict()
+    data.pop("timestamp", None)
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+async def create_live_embed(server, state: Dict, current_map: str, snapshot: CrconTickSnapshot) -> discord.Embed:
     """Erstelle Live-Update Embed"""
     match_kills = state["match_kills"]
-    match_support = state.get("match_support", {})
+    match_support = state["match_support"]
     support_available = state.get("support_available", False)
 
     timer_remaining = state.get("last_timer_remaining")
     allied_score = state.get("last_allied_score", 0)
     axis_score = state.get("last_axis_score", 0)
     if timer_remaining is None and allied_score == 0 and axis_score == 0:
-        timer_remaining, allied_score, axis_score = get_match_timer_and_score(server)
+        timer_remaining, allied_score, axis_score = await snapshot.get_match_timer_and_score()
     
-    # Sortiere nach Kills
-    sorted_killers = sorted(
-        match_kills.items(),
-        key=lambda x: x[1]["kills"],
-        reverse=True
-    )[:10]
+    # Top 10 direkt aus der gepflegten Rangliste
+    sorted_killers = match_kills.top(10)
     
     # Timer & Score formatieren
     timer_text = ""
     if timer_remaining is not None:
-        minutes = int(timer_remaining // 60)
-        seconds = int(timer_remaining % 60)
+        display_remaining = _timer_display_bucket(timer_remaining)
+        minutes = int(display_remaining // 60)
+        seconds = int(display_remaining % 60)
         timer_emoji = "🟢"
         if timer_remaining <= 80:
             timer_emoji = "🔴"  # Kritisch - Auswertung läuft!
@@ -747,7 +2117,7 @@ def create_live_embed(server, state: Dict, current_map: str) -> discord.Embed:
         top_text = ""
         for rank, (steam_id, data) in enumerate(sorted_killers, 1):
             emoji = {1: EMOJI_MEDAL_1, 2: EMOJI_MEDAL_2, 3: EMOJI_MEDAL_3}.get(rank, EMOJI_STAR)
-            top_text += f"{emoji} **{data['name'][:25]}** - {data['kills']} Kills\n"
+            top_text += f"{emoji} **{data.name[:25]}** - {data.kills} Kills\n"
         
         embed.add_field(name="Top 10 Killer", value=top_text or "Noch keine Kills", inline=False)
     else:
@@ -755,33 +2125,23 @@ def create_live_embed(server, state: Dict, current_map: str) -> discord.Embed:
 
     # Top Support (falls verfügbar)
     if match_support and support_available:
-        sorted_support = sorted(
-            match_support.items(),
-            key=lambda x: x[1]["support"],
-            reverse=True
-        )[:10]
+        sorted_support = match_support.top(10)
         support_text = ""
         for rank, (steam_id, data) in enumerate(sorted_support, 1):
             emoji = {1: EMOJI_MEDAL_1, 2: EMOJI_MEDAL_2, 3: EMOJI_MEDAL_3}.get(rank, EMOJI_STAR)
-            support_text += f"{emoji} **{data['name'][:25]}** - {data['support']} Support\n"
+            support_text += f"{emoji} **{data.name[:25]}** - {data.support} Support\n"
         embed.add_field(name="Top 10 Support", value=support_text or "Keine Support-Daten", inline=False)
     else:
         embed.add_field(name="Top 10 Support", value="Support-Punkte sind erst nach Match-Ende verfÃ¼gbar.", inline=False)
     
-    embed.set_footer(text=f"{EMOJI_REFRESH} Auto-Update alle 5 Sekunden")
+    embed.set_footer(text=f"{EMOJI_REFRESH} Auto-Update bei Änderungen")
     
     return embed
 
 
 def create_final_embed(server, state: Dict, current_map: str, top_winners: List) -> discord.Embed:
     """Erstelle finales Match-Ende Embed"""
-    match_kills = state["match_kills"]
-    
-    sorted_killers = sorted(
-        match_kills.items(),
-        key=lambda x: x[1]["kills"],
-        reverse=True
-    )[:10]
+    sorted_killers = state["match_kills"].top(10)
     
     embed = discord.Embed(
         title=f"{EMOJI_TROPHY} Match beendet - {server['name']}",
@@ -794,15 +2154,15 @@ def create_final_embed(server, state: Dict, current_map: str, top_winners: List)
         winner_text = f"Max. 3x +24h VIP vergeben\n\n"
         for rank, steam_id, data, hours, success in top_winners:
             emoji = {1: EMOJI_MEDAL_1, 2: EMOJI_MEDAL_2, 3: EMOJI_MEDAL_3}.get(rank, f"#{rank}")
-            status = EMOJI_CHECK if success else EMOJI_CROSS
-            winner_text += f"{status} {emoji} **{data['name'][:25]}** - {data['kills']} Kills -> +{hours}h VIP\n"
+            status = EMOJI_PENDING if success is None else (EMOJI_CHECK if success else EMOJI_CROSS)
+            winner_text += f"{status} {emoji} **{data.name[:25]}** - {data.kills} Kills -> +{hours}h VIP\n"
 
         embed.add_field(name=f"{EMOJI_GIFT} VIP Belohnungen vergeben", value=winner_text, inline=False)
     
     if sorted_killers:
         top_text = ""
         for rank, (steam_id, data) in enumerate(sorted_killers, 1):
-            top_text += f"{rank}. **{data['name'][:25]}** - {data['kills']} Kills\n"
+            top_text += f"{rank}. **{data.name[:25]}** - {data.kills} Kills\n"
 
         embed.add_field(name=f"{EMOJI_BAR_CHART} Top 10 Gesamt", value=top_text, inline=False)
     
@@ -811,7 +2171,7 @@ def create_final_embed(server, state: Dict, current_map: str, top_winners: List)
     return embed
 
 
-async def process_match_end(server, state: Dict, channel):
+async def process_match_end(server, state: Dict, channel, snapshot: CrconTickSnapshot):
     """Verarbeite Match-Ende und vergebe bis zu 3 VIP-Belohnungen"""
     if state["match_rewarded"]:
         return
@@ -823,25 +2183,39 @@ async def process_match_end(server, state: Dict, channel):
         state["match_rewarded"] = True
         return
     
-    # Sortiere nach Kills
-    sorted_killers = sorted(
-        match_kills.items(),
-        key=lambda x: x[1]["kills"],
-        reverse=True
-    )
+    # Vollstaendige Rangliste (Gleichstand: wer zuerst eingetragen wurde)
+    sorted_killers = match_kills.ranked()
     
     vip_awarded_count = 0
     top_winners = []
+    award_keys = []
+    pm_batch = []
     hours_per_award = 24
+    match_key = _match_key(state)
+
+    # Ein frischer VIP-Abruf je Ziel-Server; die Award-Jobs dieses Matches verwenden diesen Stand.
+    # Der Index des eigenen Servers dient hier nur der Lifetime-Pruefung.
+    vip_snapshot_at = time.monotonic()
+    target_indexes = await asyncio.gather(*[
+        snapshot.get_vip_index(max_age=0) if target["base_url"] == server["base_url"]
+        else get_cached_vip_index(target, max_age=0)
+        for target in servers
+    ])
+    vip_index = next(
+        (index for target, index in zip(servers, target_indexes) if target["base_url"] == server["base_url"]),
+        None
+    ) or {}
+    cache = _vip_cache(server)
+    logger.info(f"[{server['name']}] VIP-Cache: {cache['hits']} Hits / {cache['misses']} Misses")
 
     for rank, (steam_id, data) in enumerate(sorted_killers, 1):
         if vip_awarded_count >= 3:
             break
 
-        player_name = data["name"]
-        kills = data["kills"]
-        current_exp = get_vip_expiration(server, steam_id)
-        lifetime = is_lifetime_vip(current_exp)
+        player_name = data.name
+        kills = data.kills
+        current_exp = vip_index.get(steam_id)
+        lifetime = _is_lifetime_expiration(current_exp)
 
         if lifetime:
             pm_message = (
@@ -849,49 +2223,41 @@ async def process_match_end(server, state: Dict, channel):
                 f"You placed Top Killer #{rank} with {kills} kills."
             )
             logger.info(f"[{server['name']}] 📨 Sende PM an Lifetime VIP Top Killer #{rank}: {player_name} ({steam_id})")
-            pm_success = await _run_blocking(send_private_message, server, steam_id, player_name, pm_message)
-            if not pm_success:
-                logger.warning(f"[{server['name']}] ⚠️ PM konnte nicht gesendet werden an {player_name} (möglicherweise disconnected)")
+            pm_batch.append((steam_id, player_name, pm_message))
             continue
 
-        expiration_dt = _compute_award_expiration(server, steam_id, hours_per_award)
-        expiration_text = (
-            expiration_dt.strftime("%Y-%m-%d %H:%M UTC") if expiration_dt else "unknown time"
-        )
-
-        per_server_success = await asyncio.gather(
-            *[
-                _run_blocking(add_vip_hours, target_server, steam_id, player_name, hours_per_award)
-                for target_server in servers
-            ]
-        )
-        success = all(per_server_success)
-        top_winners.append((rank, steam_id, data, hours_per_award, success))
-
-        status = EMOJI_CHECK if success else EMOJI_CROSS
+        # Vergabe + Glueckwunsch-PM uebernimmt der Hintergrund-Worker
+        # Schreibfehler im Journal bricht hier ab - Match bleibt unbelohnt und wird erneut versucht
+        award_keys.extend(await award_pipeline.enqueue(
+            match_key, server, steam_id, player_name, rank, kills, hours_per_award,
+            vip_snapshot_at=vip_snapshot_at
+        ))
+        top_winners.append((rank, steam_id, data.copy(), hours_per_award, None))
+        vip_awarded_count += 1
         logger.info(
-            f"[{server['name']}] {status} Platz {rank}: {player_name} ({steam_id}) - {kills} Kills - +{hours_per_award}h VIP"
+            f"[{server['name']}] {EMOJI_PENDING} Platz {rank}: {player_name} ({steam_id}) - {kills} Kills - +{hours_per_award}h VIP eingereiht"
         )
 
-        if success:
-            vip_awarded_count += 1
-            pm_message = (
-                "🏆 CONGRATULATIONS! 🏆\n"
-                f"You placed Top Killer #{rank} with {kills} kills. "
-                f"Your VIP has been extended until {expiration_text}."
-            )
-            logger.info(f"[{server['name']}] 📨 Sende PM an Top Killer #{rank}: {player_name} ({steam_id})")
-            pm_success = await _run_blocking(send_private_message, server, steam_id, player_name, pm_message)
-            if not pm_success:
-                logger.warning(f"[{server['name']}] ⚠️ PM konnte nicht gesendet werden an {player_name} (möglicherweise disconnected)")
+    # Alle Match-Ende-PMs gesammelt einreihen (Versand im Hintergrund)
+    _pm_dispatcher(server).send_batch(pm_batch)
+
+    # Jobs sind im Journal - Match sofort als belohnt speichern
+    state["match_rewarded"] = True
+    await save_state(force=True)
     
     # "Freeze" die Live-Message mit finalem Embed
-    current_map, _ = get_current_map(server)
-    final_embed = create_final_embed(server, state, current_map, top_winners)
+    current_map, _ = await snapshot.get_current_map()
+    final_state = {"match_kills": Leaderboard("kills", {steam_id: data.copy() for steam_id, data in match_kills.items()})}
+    final_embed = create_final_embed(server, final_state, current_map, top_winners)
+    final_message = None
+    # Wartende Live-Edits dieses Servers duerfen das finale Embed nicht ueberschreiben
+    discord_scheduler.drop(server["base_url"])
     
     if state["live_message"]:
         try:
-            await state["live_message"].edit(embed=final_embed)
+            live_message = state["live_message"]
+            await discord_scheduler.submit(DISCORD_PRIORITY_FINAL, lambda: live_message.edit(embed=final_embed))
+            final_message = live_message
             logger.info(f"[{server['name']}] âœ“ Live-Message eingefroren mit finalen Ergebnissen")
         except Exception as e:
             logger.error(f"Fehler beim Einfrieren der Live-Message: {e}")
@@ -899,27 +2265,330 @@ async def process_match_end(server, state: Dict, channel):
     # Sende Benachrichtigung, sobald Match beendet und finale Punkteanzeige verfügbar ist
     try:
         if state["live_message"]:
-            await channel.send(
+            await discord_scheduler.submit(DISCORD_PRIORITY_NOTICE, lambda: channel.send(
                 f"🏁 **Match beendet auf {server['name']}** – Die finale Punkteanzeige ist jetzt verfügbar."
-            )
+            ))
         else:
-            await channel.send(
+            final_message = await discord_scheduler.submit(DISCORD_PRIORITY_FINAL, lambda: channel.send(
                 f"🏁 **Match beendet auf {server['name']}** – Die finale Punkteanzeige ist jetzt verfügbar.",
                 embed=final_embed
-            )
+            ))
     except Exception as e:
         logger.error(f"Fehler beim Senden der Match-Ende Nachricht: {e}")
+
+    if award_keys and final_message is not None:
+        # Referenz halten, sonst kann der GC den wartenden Task einsammeln
+        task = asyncio.create_task(_refresh_final_embed(
+            server, final_state, current_map, top_winners, final_message, match_key, award_keys
+        ))
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
     
-    state["match_rewarded"] = True
     logger.info(f"[{server['name']}] ✓ Match abgeschlossen – Punkteanzeige gesendet")
 
 
-async def process_server(server, channel):
+async def _refresh_final_embed(server, final_state: Dict, current_map: str, top_winners: List, message, match_key: str, award_keys: List[str]):
+    """Finales Embed mit den tatsaechlichen Vergabe-Ergebnissen aktualisieren"""
+    await award_pipeline.wait_for(award_keys)
+    top_winners = [
+        (rank, steam_id, data, hours, award_pipeline.group_success(match_key, steam_id))
+        for rank, steam_id, data, hours, _ in top_winners
+    ]
+    for rank, steam_id, data, hours, success in top_winners:
+        status = EMOJI_CHECK if success else EMOJI_CROSS
+        logger.info(
+            f"[{server['name']}] {status} Platz {rank}: {data.name} ({steam_id}) - {data.kills} Kills - +{hours}h VIP"
+        )
+    try:
+        final_embed = create_final_embed(server, final_state, current_map, top_winners)
+        await discord_scheduler.submit(DISCORD_PRIORITY_FINAL, lambda: message.edit(embed=final_embed))
+    except Exception as e:
+        logger.error(f"[{server['name']}] Fehler beim Aktualisieren des finalen Embeds: {e}")
+
+
+def _player_record(state: Dict, steam_id: str, name: Optional[str] = None) -> PlayerRecord:
+    """Datensatz des Spielers im aktuellen Match holen bzw. anlegen"""
+    record = state["players"].get(steam_id)
+    if record is None:
+        record = PlayerRecord(steam_id, name or "Unknown")
+        state["players"][record.steam_id] = record
+    return record
+
+
+def _apply_rows(state: Dict, board: Leaderboard, rows: Dict[str, Tuple[str, int]], update_name: bool = True) -> int:
+    """Leaderboard auf `rows` (steam_id -> (name, wert)) bringen; Anzahl geaenderter Zeilen"""
+    field = board.field
+    empty = 0 if field == "kills" else None
+    changed = 0
+    for steam_id in [steam_id for steam_id in board if steam_id not in rows]:
+        setattr(board[steam_id], field, empty)
+        del board[steam_id]
+        changed += 1
+    for steam_id, (name, value) in rows.items():
+        record = _player_record(state, steam_id, name)
+        if getattr(record, field) != value or (update_name and record.name != name):
+            setattr(record, field, value)
+            if update_name:
+                record.name = name
+            # Schluessel ist die internierte ID des Records, nicht der Zeilen-String
+            board[record.steam_id] = record
+            changed += 1
+        elif steam_id not in board:
+            board[record.steam_id] = record
+            changed += 1
+    return changed
+
+
+def _rebuild_match_stats(server, state: Dict, players: List[Dict], players_endpoint, map_scoreboard, snapshot) -> Tuple[int, int]:
+    """match_kills/match_support aus den Scoreboard-Daten abgleichen.
+
+    Es werden nur geaenderte Zeilen geschrieben bzw. entfernt. Gibt
+    (Spieler mit Kills seit Matchstart, Anzahl geaenderter Zeilen) zurueck.
+    """
+    kill_rows: Dict[str, Tuple[str, int]] = {}
+    support_rows: Dict[str, Tuple[str, int]] = {}
+
+    support_players = None
+    map_players = None
+    players_endpoint_players = None
+    schemas = state["payload_schemas"]
+    # Leere Antworten zaehlen ebenfalls als "nicht brauchbar"
+    has_support = False
+    if players_endpoint:
+        players_endpoint_players = extract_scoreboard_players(players_endpoint, schemas, "get_players")
+        has_support = any(row.support is not None for row in players_endpoint_players)
+        if has_support:
+            support_players = players_endpoint_players
+    snapshot.report_endpoint("get_players", has_support)
+
+    has_support = False
+    if map_scoreboard:
+        map_players = extract_scoreboard_players(map_scoreboard, schemas, "get_map_scoreboard")
+        has_support = any(row.support is not None for row in map_players)
+    snapshot.report_endpoint("get_map_scoreboard", has_support)
+    if support_players is None and has_support:
+        support_players = map_players
+
+    if support_players is None:
+        support_players = players
+
+    for player in players:
+        steam_id = player.steam_id
+        player_name = player.name
+        kills = player.kills
+
+        if not steam_id:
+            continue
+        
+        # Baseline abziehen (Kills seit Matchstart)
+        record = _player_record(state, steam_id, player_name)
+        if kills < record.baseline:
+            # Spieler hat sich evtl. reconnectet, baseline anpassen
+            record.baseline = kills
+        match_kills = max(0, record.offset + (kills - record.baseline))
+
+        # Nur Spieler mit Kills seit Matchstart
+        if match_kills > 0:
+            kill_rows[steam_id] = (player_name, match_kills)
+
+    support_nonzero_found = False
+    for player in support_players:
+        support_points = player.support
+        if not player.steam_id:
+            continue
+
+        if support_points is not None:
+            support_rows[player.steam_id] = (player.name, support_points)
+            if support_points > 0:
+                support_nonzero_found = True
+
+    state["support_available"] = support_nonzero_found
+    # Namen kommen aus dem Live-Scoreboard; Support-Quellen aendern ihn nicht
+    changed = (
+        _apply_rows(state, state["match_kills"], kill_rows)
+        + _apply_rows(state, state["match_support"], support_rows, update_name=False)
+    )
+
+    if not state["support_debug_logged"]:
+        sample_source = support_players[0] if support_players else None
+        if sample_source:
+            if players_endpoint_players is not None and support_players is players_endpoint_players:
+                source, source_endpoint = "players", "get_players"
+            elif map_players is not None and support_players is map_players:
+                source, source_endpoint = "map", "get_map_scoreboard"
+            else:
+                source, source_endpoint = "live", "get_live_scoreboard"
+            schema = schemas.get(source_endpoint)
+            logger.info(
+                f"[{server['name']}] Support-Debug: Schema {schema.describe() if schema else '-'} | "
+                f"Beispiel: {sample_source} | Quelle={source}"
+            )
+        if players_endpoint is None:
+            logger.info(f"[{server['name']}] Support-Debug: Players-Endpoint nicht verfÃ¼gbar (API/Permission?).")
+        if map_scoreboard is None:
+            logger.info(f"[{server['name']}] Support-Debug: Map-Scoreboard nicht verfÃ¼gbar (API/Permission?).")
+        state["support_debug_logged"] = True
+
+    return len(kill_rows), changed
+
+
+async def _check_match_end(server, state: Dict, channel, snapshot: CrconTickSnapshot):
+    """Match-Ende ueber Timer/Score erkennen und ggf. auswerten"""
+    if not state.get("current_match_id") or state.get("match_rewarded"):
+        return
+
+    remaining, allied_score, axis_score = await snapshot.get_match_timer_and_score()
+    state["last_timer_remaining"] = remaining
+    state["last_allied_score"] = allied_score
+    state["last_axis_score"] = axis_score
+
+    match_ended = False
+    end_reason = ""
+
+    if remaining is not None and remaining <= 0:
+        match_ended = True
+        end_reason = "Timer abgelaufen"
+    elif (allied_score >= 5 or axis_score >= 5):
+        match_ended = True
+        end_reason = f"Score 5:x erreicht ({allied_score}:{axis_score})"
+    elif remaining is not None:
+        if state["last_timer"] is not None and state["last_timer"] <= 90 and remaining > 90:
+            state["timer_below_90s_seen"] = False
+            logger.info(
+                f"[{server['name']}] ⏱️ Timer wieder ueber 90s ({remaining:.0f}s) - Reset fuer 2. Erkennung"
+            )
+
+        if remaining <= 90:
+            if not state["timer_below_90s_seen"]:
+                state["timer_below_90s_seen"] = True
+                logger.info(
+                    f"[{server['name']}] ⏱️ 1. Mal Timer <=90s erkannt "
+                    f"({remaining:.0f}s, Score {allied_score}:{axis_score})"
+                )
+            else:
+                match_ended = True
+                end_reason = f"2. Mal Timer <=90s ({remaining:.0f}s, Score {allied_score}:{axis_score})"
+
+        state["last_timer"] = remaining
+    else:
+        state["last_timer"] = None
+
+    if match_ended:
+        logger.info(f"[{server['name']}] 🏁 Match-Ende erkannt: {end_reason}")
+        await process_match_end(server, state, channel, snapshot)
+
+
+async def _ingest_kill_events(server, state: Dict, snapshot: CrconTickSnapshot) -> bool:
+    """Neue Kill-Events seit der Watermark zaehlen (Aufwand O(neue Events)).
+
+    Das Abruf-Limit richtet sich nach der beobachteten Log-Rate; ist die
+    Seite komplett neu, wird mit doppeltem Limit bis zur Watermark
+    zurueckgeblaettert. Gibt False zurueck, wenn die Logs nicht abrufbar sind.
+    """
+    cursor = state["log_cursor"]
+    watermark = cursor["watermark"]
+    now = time.monotonic()
+    elapsed = now - cursor["polled_at"] if cursor["polled_at"] else POLL_INTERVAL_MAX_SECONDS
+
+    if watermark:
+        limit = min(LOG_LIMIT_MAX, LOG_LIMIT_MIN + int(cursor["rate"] * elapsed * LOG_LIMIT_HEADROOM))
+    else:
+        limit = LOG_LIMIT_INITIAL
+
+    while True:
+        logs = await snapshot.client.get_historical_logs(limit)
+        if logs is None:
+            return False
+        new_logs = [log for log in logs if (log.get("id") or 0) > watermark]
+        page_full = len(logs) >= limit and len(new_logs) == len(logs)
+        if not watermark or not page_full or limit >= LOG_LIMIT_MAX:
+            break
+        limit = min(LOG_LIMIT_MAX, limit * 2)
+        logger.info(f"[{server['name']}] Log-Seite voll ({len(logs)} neue Eintraege) - blaettere zurueck (limit={limit})")
+
+    if watermark and logs:
+        rate = len(new_logs) / max(elapsed, 1.0)
+        cursor["rate"] = LOG_RATE_SMOOTHING * rate + (1 - LOG_RATE_SMOOTHING) * cursor["rate"]
+    cursor["polled_at"] = now
+    if not new_logs:
+        return True
+
+    cursor["watermark"] = max(log.get("id") or 0 for log in new_logs)
+    if not watermark:
+        # Erster Abruf: aeltere Events gehoeren zu frueheren Matches,
+        # der Stand kommt aus dem Scoreboard-Abgleich
+        return True
+
+    for log in reversed(new_logs):
+        log_type = (log.get("type") or "").upper()
+        # Nur regulaere Kills zaehlen (keine Teamkills)
+        if "KILL" not in log_type or "TEAM KILL" in log_type:
+            continue
+        killer_id = log.get("player1_id")
+        if not killer_id:
+            continue
+        record = _player_record(state, killer_id)
+        record.name = log.get("player1_name") or record.name
+        state["log_kills"][record.steam_id] = state["log_kills"].get(record.steam_id, 0) + 1
+        record.kills = state["log_kills"][record.steam_id]
+        state["match_kills"][record.steam_id] = record
+        state["rows_version"] += 1
+    return True
+
+
+def _reconcile_log_kills(server, state: Dict) -> int:
+    """Event-Zaehlung mit den Scoreboard-Kills (match_kills) abgleichen.
+
+    Pro Spieler gilt der hoehere Wert: fehlende Events holt das Scoreboard
+    nach, ein Reconnect (Scoreboard zaehlt neu) drueckt die Events nicht.
+    Gibt die Anzahl geaenderter Zeilen zurueck.
+    """
+    log_kills = state["log_kills"]
+    corrected = 0
+    for steam_id, record in state["match_kills"].items():
+        if record.kills > log_kills.get(steam_id, 0):
+            log_kills[steam_id] = record.kills
+            corrected += 1
+    changed = 0
+    for steam_id, kills in log_kills.items():
+        record = _player_record(state, steam_id)
+        if kills > 0 and (record.kills != kills or steam_id not in state["match_kills"]):
+            record.kills = kills
+            state["match_kills"][record.steam_id] = record
+            changed += 1
+    if corrected:
+        logger.info(f"[{server['name']}] Kill-Abgleich: {corrected} Spieler aus dem Scoreboard korrigiert")
+    return changed
+
+
+async def process_server(server, channel, snapshot: CrconTickSnapshot):
     """Verarbeite Stats fÃ¼r einen Server"""
     state = server_states[server["base_url"]]
 
-    scoreboard = get_live_scoreboard(server)
+    # Inaktiver Server: erst guenstig per get_status pruefen, bevor das
+    # Scoreboard (langer Timeout) wieder abgefragt wird
+    if state.get("inactive_since") and not await snapshot.client.probe_status():
+        state["inactive_failures"] = state.get("inactive_failures", 0) + 1
+        return
+
+    use_logs = KILL_TRACKING_MODE == "logs"
+    if use_logs and not state.get("inactive_since"):
+        # Zwischen zwei Abgleichen nur neue Kill-Events verarbeiten; ein
+        # Matchwechsel erzwingt den Scoreboard-Abgleich (neue Baseline)
+        _, match_id = await snapshot.get_current_map()
+        if match_id == state["current_match_id"] and time.monotonic() < state["reconcile_at"]:
+            if not await _ingest_kill_events(server, state, snapshot):
+                state["inactive_failures"] = state.get("inactive_failures", 0) + 1
+                state["inactive_since"] = datetime.now(timezone.utc)
+                logger.warning(f"[{server['name']}] Server ist inaktiv seit {state['inactive_since'].isoformat()}")
+                return
+            if not state.get("paused_low_pop"):
+                await _check_match_end(server, state, channel, snapshot)
+            return
+
+    scoreboard = await snapshot.get_live_scoreboard()
     if scoreboard is None:
+        state["inactive_failures"] = state.get("inactive_failures", 0) + 1
         if not state.get("inactive_since"):
             state["inactive_since"] = datetime.now(timezone.utc)
             logger.warning(f"[{server['name']}] Server ist inaktiv seit {state['inactive_since'].isoformat()}")
@@ -929,19 +2598,18 @@ async def process_server(server, channel):
         inactive_for = datetime.now(timezone.utc) - state["inactive_since"]
         logger.info(f"[{server['name']}] Server wieder aktiv nach {inactive_for}")
         state["inactive_since"] = None
+        state["inactive_failures"] = 0
 
         # Restart counting from current stats while keeping previous totals
-        state["kill_offsets"] = {}
-        for steam_id, data in state["match_kills"].items():
-            state["kill_offsets"][steam_id] = data.get("kills", 0)
-        for player in extract_scoreboard_players(scoreboard):
-            steam_id = player.get("player_id") or player.get("steam_id_64")
-            kills = player.get("kills", 0)
-            if steam_id and steam_id != "None":
-                state["baseline_kills"][steam_id] = kills
+        state["ingest_key"] = None
+        for record in state["players"].values():
+            record.offset = record.kills
+        for player in extract_scoreboard_players(scoreboard, state["payload_schemas"], "get_live_scoreboard"):
+            if player.steam_id:
+                _player_record(state, player.steam_id).baseline = player.kills
 
     # Hole aktuelle Map/Match
-    current_map, match_id = get_current_map(server)
+    current_map, match_id = await snapshot.get_current_map()
     state["current_map"] = current_map
 
     map_changed = False
@@ -950,16 +2618,15 @@ async def process_server(server, channel):
         if state["current_match_id"]:
             logger.info(f"[{server['name']}] Match-Ende erkannt: {state['current_match_id']}")
             # Verarbeite vorheriges Match
-            await process_match_end(server, state, channel)
+            await process_match_end(server, state, channel, snapshot)
         
         # Reset fÃ¼r neues Match
         logger.info(f"[{server['name']}] Neues Match gestartet: {match_id}")
         map_changed = True
         state["current_match_id"] = match_id
-        state["match_kills"] = defaultdict(lambda: {"name": "", "kills": 0})
-        state["match_support"] = defaultdict(lambda: {"name": "", "support": 0})
-        state["baseline_kills"] = {}
-        state["kill_offsets"] = {}
+        state["match_kills"] = Leaderboard("kills")
+        state["match_support"] = Leaderboard("support")
+        state["players"] = {}
         state["match_start"] = datetime.now(timezone.utc)
         state["match_rewarded"] = False
         state["timer_below_90s_seen"] = False
@@ -970,22 +2637,26 @@ async def process_server(server, channel):
         state["live_message"] = None
         state["last_update"] = None
         state["support_debug_logged"] = False
+        state["ingest_key"] = None
+        state["log_kills"] = {}
+        # Events vor dem Matchwechsel nicht mitzaehlen: Watermark neu setzen
+        state["log_cursor"]["watermark"] = 0
 
         # Baseline-Kills beim Matchstart setzen (damit Kills bei 0 starten)
-        start_players = extract_scoreboard_players(scoreboard)
+        start_players = extract_scoreboard_players(scoreboard, state["payload_schemas"], "get_live_scoreboard")
         for player in start_players:
-            steam_id = player.get("player_id") or player.get("steam_id_64")
-            kills = player.get("kills", 0)
-            if steam_id and steam_id != "None":
-                state["baseline_kills"][steam_id] = kills
-    
-    # WICHTIG: Reset match_kills VOR dem Update, um alte Daten zu lÃ¶schen
-    state["match_kills"].clear()
-    state["match_support"].clear()
+            if player.steam_id:
+                _player_record(state, player.steam_id, player.name).baseline = player.kills
     
-    # Verarbeite Spieler-Stats
+    # Verarbeite Spieler-Stats; byte-identisches Scoreboard -> Extraktion wiederverwenden
     player_count = 0
-    players = extract_scoreboard_players(scoreboard)
+    scoreboard_digest = snapshot.payload_digest("get_live_scoreboard")
+    if scoreboard_digest is not None and scoreboard_digest == state.get("scoreboard_digest"):
+        players = state["scoreboard_players"]
+    else:
+        players = extract_scoreboard_players(scoreboard, state["payload_schemas"], "get_live_scoreboard")
+        state["scoreboard_digest"] = scoreboard_digest
+        state["scoreboard_players"] = players
     
     if isinstance(scoreboard, dict):
         logger.info(f"[{server['name']}] Scoreboard-Keys: {list(scoreboard.keys())}")
@@ -993,13 +2664,19 @@ async def process_server(server, channel):
     logger.info(f"[{server['name']}] Anzahl Spieler im Scoreboard: {len(players)}")
 
     if len(players) < 20:
+        state["match_kills"].clear()
+        state["match_support"].clear()
+        state["ingest_key"] = None
+        state["rows_version"] += 1
         if not state.get("paused_low_pop"):
             state["paused_low_pop"] = True
             logger.info(f"[{server['name']}] Low-Pop erkannt (<20 Spieler) - Bot pausiert")
 
             if state.get("live_message"):
+                discord_scheduler.drop(server["base_url"])
+                live_message = state["live_message"]
                 try:
-                    await state["live_message"].delete()
+                    await discord_scheduler.submit(DISCORD_PRIORITY_NOTICE, live_message.delete)
                     logger.info(f"[{server['name']}] Live-Message geloescht (Low-Pop)")
                 except Exception as e:
                     logger.error(f"[{server['name']}] Fehler beim Loeschen der Live-Message: {e}")
@@ -1013,131 +2690,205 @@ async def process_server(server, channel):
         state["paused_low_pop"] = False
         logger.info(f"[{server['name']}] Spielerzahl >=20 - Bot wieder aktiv")
     
-    # Support-Daten bevorzugt aus Map-Scoreboard (falls verfÃ¼gbar)
-    support_players = None
-    map_players = None
-    players_endpoint_players = None
-    players_endpoint = get_players(server)
-    if players_endpoint:
-        players_endpoint_players = extract_scoreboard_players(players_endpoint)
-        if any(_extract_support_points(p) is not None for p in players_endpoint_players):
-            support_players = players_endpoint_players
+    # Support-Daten bevorzugt aus Map-Scoreboard (falls verfÃ¼gbar).
+    # Beide Endpoints liegen hinter dem Circuit-Breaker und zaehlen nur als
+    # brauchbar, wenn sie tatsaechlich Support-Felder liefern
+    players_endpoint = await snapshot.get_players()
+    map_scoreboard = await snapshot.get_map_scoreboard()
+
+    # Alle drei Antworten byte-identisch zum letzten Durchlauf -> match_kills
+    # und match_support sind schon aktuell, Neuaufbau ueberspringen
+    ingest_key = (
+        scoreboard_digest,
+        snapshot.payload_digest("get_players"),
+        snapshot.payload_digest("get_map_scoreboard"),
+    )
+    if use_logs:
+        await _ingest_kill_events(server, state, snapshot)
+        state["reconcile_at"] = time.monotonic() + KILL_RECONCILE_SECONDS
+    if scoreboard_digest is not None and ingest_key == state.get("ingest_key"):
+        logger.debug(f"[{server['name']}] Scoreboard unveraendert - Neuaufbau uebersprungen")
+        player_count = len(state["match_kills"])
+        changed = 0
+    else:
+        player_count, changed = _rebuild_match_stats(
+            server, state, players, players_endpoint, map_scoreboard, snapshot
+        )
+        if use_logs:
+            changed += _reconcile_log_kills(server, state)
+        state["ingest_key"] = ingest_key
+    state["rows_version"] += changed
 
-    map_scoreboard = get_map_scoreboard(server)
-    if map_scoreboard:
-        map_players = extract_scoreboard_players(map_scoreboard)
-        if support_players is None and any(_extract_support_points(p) is not None for p in map_players):
-            support_players = map_players
+    logger.info(f"[{server['name']}] Verarbeitete Spieler mit Kills: {player_count}/{len(players)} (geaendert: {changed})")
 
-    if support_players is None:
-        support_players = players
+    if not map_changed:
+        await _check_match_end(server, state, channel, snapshot)
 
-    for player in players:
-        if not isinstance(player, dict):
-            continue
-            
-        steam_id = player.get("player_id") or player.get("steam_id_64")
-        player_name = player.get("player") or player.get("name", "Unknown")
-        kills = player.get("kills", 0)
-        
-        if not steam_id or steam_id == "None":
-            continue
-        
-        # Baseline abziehen (Kills seit Matchstart)
-        baseline = state["baseline_kills"].get(steam_id, 0)
-        if kills < baseline:
-            # Spieler hat sich evtl. reconnectet, baseline anpassen
-            state["baseline_kills"][steam_id] = kills
-            baseline = kills
-        offset = state.get("kill_offsets", {}).get(steam_id, 0)
-        match_kills = max(0, offset + (kills - baseline))
 
-        # Update nur wenn Spieler Kills seit Matchstart hat
-        if match_kills > 0:
-            state["match_kills"][steam_id] = {"name": player_name, "kills": match_kills}
-            player_count += 1
+async def update_server(server, channel):
+    """Verarbeite einen Server und aktualisiere dessen Live-Message"""
+    state = server_states[server["base_url"]]
+    # Ein Snapshot pro Tick: jeder Endpoint wird hoechstens einmal abgefragt
+    snapshot = CrconTickSnapshot(server["client"])
 
-    support_nonzero_found = False
-    for player in support_players:
-        if not isinstance(player, dict):
-            continue
-        steam_id = player.get("player_id") or player.get("steam_id_64") or player.get("player_id")
-        player_name = player.get("player") or player.get("name", "Unknown")
-        if not steam_id or steam_id == "None":
-            continue
+    # Verarbeite Server (Logs abrufen)
+    await process_server(server, channel, snapshot)
 
-        support_points = _extract_support_points(player)
-        if support_points is not None:
-            state["match_support"][steam_id] = {"name": player_name, "support": support_points}
-            if support_points > 0:
-                support_nonzero_found = True
+    # Debug-Info
+    logger.info(f"[{server['name']}] Match-Status: ID={state['current_match_id']}, Rewarded={state['match_rewarded']}, Kills={len(state['match_kills'])}")
 
-    state["support_available"] = support_nonzero_found
+    # Nur Live-Update wenn Match lÃ¤uft und nicht belohnt
+    if (
+        state["current_match_id"]
+        and not state["match_rewarded"]
+        and not state.get("inactive_since")
+        and not state.get("paused_low_pop")
+    ):
+        # Keine geaenderten Zeilen und gleiche Anzeige-Eingaben wie beim
+        # letzten geschriebenen Embed -> Embed gar nicht erst aufbauen
+        view_key = (state["rows_version"], _live_view(state))
+        if state["live_message"] and view_key == (state.get("live_rows_version"), state.get("live_view")):
+            logger.debug(f"[{server['name']}] Keine Aenderungen - Embed-Aufbau uebersprungen")
+            return
 
-    if not state["support_debug_logged"]:
-        sample_source = support_players[0] if support_players else None
-        if sample_source:
-            sample_keys = list(sample_source.keys())
-            sample_support = sample_source.get("support")
-            logger.info(
-                f"[{server['name']}] Support-Debug: Beispiel-Keys im Scoreboard: {sample_keys} | "
-                f"support={sample_support} (type={type(sample_support).__name__}) | "
-                f"Quelle={'players' if (players_endpoint_players is not None and support_players is players_endpoint_players) else ('map' if (map_players is not None and support_players is map_players) else 'live')}"
-            )
-        if players_endpoint is None:
-            logger.info(f"[{server['name']}] Support-Debug: Players-Endpoint nicht verfÃ¼gbar (API/Permission?).")
-        if map_scoreboard is None:
-            logger.info(f"[{server['name']}] Support-Debug: Map-Scoreboard nicht verfÃ¼gbar (API/Permission?).")
-        state["support_debug_logged"] = True
-            
-    logger.info(f"[{server['name']}] Verarbeitete Spieler mit Kills: {player_count}/{len(players)}")
-
-    if not map_changed and state.get("current_match_id") and not state.get("match_rewarded"):
-        remaining, allied_score, axis_score = get_match_timer_and_score(server)
-        state["last_timer_remaining"] = remaining
-        state["last_allied_score"] = allied_score
-        state["last_axis_score"] = axis_score
-
-        match_ended = False
-        end_reason = ""
-
-        if remaining is not None and remaining <= 0:
-            match_ended = True
-            end_reason = "Timer abgelaufen"
-        elif (allied_score >= 5 or axis_score >= 5):
-            match_ended = True
-            end_reason = f"Score 5:x erreicht ({allied_score}:{axis_score})"
-        elif remaining is not None:
-            if state["last_timer"] is not None and state["last_timer"] <= 90 and remaining > 90:
-                state["timer_below_90s_seen"] = False
-                logger.info(
-                    f"[{server['name']}] ⏱️ Timer wieder ueber 90s ({remaining:.0f}s) - Reset fuer 2. Erkennung"
-                )
+        current_map = state.get("current_map") or "Unknown"
+        embed = await create_live_embed(server, state, current_map, snapshot)
+        fingerprint = _embed_fingerprint(embed)
 
-            if remaining <= 90:
-                if not state["timer_below_90s_seen"]:
-                    state["timer_below_90s_seen"] = True
-                    logger.info(
-                        f"[{server['name']}] ⏱️ 1. Mal Timer <=90s erkannt "
-                        f"({remaining:.0f}s, Score {allied_score}:{axis_score})"
-                    )
-                else:
-                    match_ended = True
-                    end_reason = f"2. Mal Timer <=90s ({remaining:.0f}s, Score {allied_score}:{axis_score})"
+        if state["live_message"]:
+            # Nichts Sichtbares geaendert oder letztes Edit zu frisch -> Edit sparen
+            if fingerprint == state.get("live_fingerprint"):
+                state["live_rows_version"], state["live_view"] = view_key
+                logger.debug(f"[{server['name']}] Live-Message unveraendert - kein Edit")
+                return
+            if (time.monotonic() - state.get("live_last_edit", 0.0)) < LIVE_EDIT_MIN_SECONDS:
+                logger.debug(f"[{server['name']}] Live-Edit zusammengefasst (min. {LIVE_EDIT_MIN_SECONDS}s)")
+                return
+
+        # Nicht blockierend einreihen; ein neuerer Live-Edit ersetzt einen wartenden
+        write = discord_scheduler.submit(
+            DISCORD_PRIORITY_LIVE,
+            lambda: _write_live_message(server, channel, embed, fingerprint, view_key),
+            key=server["base_url"]
+        )
+        write.add_done_callback(_consume_write_result)
 
-            state["last_timer"] = remaining
-        else:
-            state["last_timer"] = None
 
-        if match_ended:
-            logger.info(f"[{server['name']}] 🏁 Match-Ende erkannt: {end_reason}")
-            await process_match_end(server, state, channel)
-            return
+def _live_view(state: Dict) -> Tuple:
+    """Nicht-tabellarische Eingaben des Live-Embeds (Map, Timer-Stufe, Score)"""
+    timer_remaining = state.get("last_timer_remaining")
+    return (
+        state.get("current_map"),
+        _timer_display_bucket(timer_remaining) if timer_remaining is not None else None,
+        state.get("last_allied_score", 0),
+        state.get("last_axis_score", 0),
+        state.get("support_available", False),
+        state.get("match_start"),
+    )
 
 
-@tasks.loop(seconds=5)
+def _mark_live_written(state: Dict, fingerprint: str, view_key: Tuple):
+    state["live_fingerprint"] = fingerprint
+    state["live_last_edit"] = time.monotonic()
+    state["live_rows_version"], state["live_view"] = view_key
+
+
+async def _write_live_message(server, channel, embed: discord.Embed, fingerprint: str, view_key: Tuple):
+    """Live-Message erstellen oder bearbeiten (laeuft ueber discord_scheduler)"""
+    state = server_states[server["base_url"]]
+    # Zustand kann sich seit dem Einreihen geaendert haben (Match-Ende, Low-Pop)
+    if state["match_rewarded"] or state.get("paused_low_pop") or state.get("inactive_since"):
+        return
+
+    logger.info(f"[{server['name']}] Versuche Discord-Message zu senden...")
+
+    if state["live_message"]:
+        # Update existierende Message
+        try:
+            if not state.get("live_message_id"):
+                state["live_message_id"] = state["live_message"].id
+            await state["live_message"].edit(embed=embed)
+            _mark_live_written(state, fingerprint, view_key)
+            logger.info(f"[{server['name']}] âœ“ Live-Message aktualisiert")
+        except discord.NotFound:
+            # Message wurde gelÃ¶scht, erstelle neue
+            try:
+                state["live_message"] = await channel.send(embed=embed)
+                state["live_message_id"] = state["live_message"].id
+                _mark_live_written(state, fingerprint, view_key)
+                logger.info(f"[{server['name']}] âœ“ Live-Message neu erstellt (alte gelÃ¶scht)")
+            except Exception as e:
+                if _is_rate_limited(e):
+                    raise
+                logger.error(f"[{server['name']}] âœ— Fehler beim Neuerstellen der Live-Message: {e}", exc_info=True)
+        except Exception as e:
+            # Rate-Limit an den Scheduler weiterreichen, damit er pausiert
+            if _is_rate_limited(e):
+                raise
+            logger.error(f"[{server['name']}] âœ— Fehler beim Update der Live-Message: {e}", exc_info=True)
+    else:
+        # Erstelle neue Live-Message
+        try:
+            state["live_message"] = await channel.send(embed=embed)
+            state["live_message_id"] = state["live_message"].id
+            _mark_live_written(state, fingerprint, view_key)
+            logger.info(f"[{server['name']}] âœ“ Live-Message erstellt")
+        except Exception as e:
+            if _is_rate_limited(e):
+                raise
+            logger.error(f"[{server['name']}] âœ— Fehler beim Erstellen der Live-Message: {e}", exc_info=True)
+
+
+def _inactive_backoff(failures: int) -> float:
+    """Gekappter exponentieller Backoff mit Jitter fuer inaktive Server"""
+    delay = min(INACTIVE_BACKOFF_MAX_SECONDS, INACTIVE_BACKOFF_BASE_SECONDS * 2 ** min(max(0, failures - 1), 16))
+    # Jitter verteilt die Proben mehrerer ausgefallener Server
+    return max(POLL_INTERVAL_MIN_SECONDS, delay / 2 + random.uniform(0, delay / 2))
+
+
+def _next_poll_interval(state: Dict) -> float:
+    """Abfrage-Intervall je nach Match-Phase.
+
+    Frueh im Match langsam, bei Pause im Leerlauf-Takt, bei Inaktivitaet mit
+    exponentiellem Backoff und rechtzeitig vor der 90s-Schwelle wieder im
+    vollen 5s-Takt, damit beide <=90s-Beobachtungen fuer die
+    Match-Ende-Erkennung sicher erfasst werden.
+    """
+    if state.get("inactive_since"):
+        return _inactive_backoff(state.get("inactive_failures", 0))
+    if state.get("paused_low_pop"):
+        return POLL_INTERVAL_IDLE_SECONDS
+    if not state.get("current_match_id") or state.get("match_rewarded") or state.get("timer_below_90s_seen"):
+        return POLL_INTERVAL_MIN_SECONDS
+    if max(state.get("last_allied_score", 0), state.get("last_axis_score", 0)) >= 4:
+        return POLL_INTERVAL_MIN_SECONDS
+    remaining = state.get("last_timer_remaining")
+    if remaining is None:
+        return POLL_INTERVAL_MIN_SECONDS
+    # Bis zur 90s-Schwelle hoechstens ein Zehntel der Restzeit warten
+    return max(POLL_INTERVAL_MIN_SECONDS, min(POLL_INTERVAL_MAX_SECONDS, (remaining - 90) / 10))
+
+
+async def _update_server_guarded(server, channel):
+    """Fehler eines Servers isolieren, damit die anderen Server weiterlaufen"""
+    state = server_states[server["base_url"]]
+    async with poll_semaphore:
+        started = time.monotonic()
+        try:
+            await update_server(server, channel)
+        except Exception as e:
+            logger.error(f"[{server['name']}] Fehler beim Verarbeiten des Servers: {e}", exc_info=True)
+        finally:
+            interval = _next_poll_interval(state)
+            state["next_poll_at"] = started + interval
+            logger.debug(
+                f"[{server['name']}] Tick-Dauer: {time.monotonic() - started:.2f}s, naechste Abfrage in {interval:.0f}s"
+            )
+
+
+@tasks.loop(seconds=POLL_INTERVAL_MIN_SECONDS)
 async def update_live_stats():
-    """Update Live-Stats alle 5 Sekunden"""
+    """Tick alle 5 Sekunden; jeder Server wird nach seinem adaptiven Intervall abgefragt"""
     if shutdown_requested:
         update_live_stats.cancel()
         return
@@ -1150,51 +2901,18 @@ async def update_live_stats():
             logger.warning(f"âš ï¸ Channel nicht gefunden! Channel-ID: {DISCORD_CHANNEL_ID}, Bot Ready: {bot.is_ready()}")
             return
         
-        for server in servers:
-            state = server_states[server["base_url"]]
-            
-            # Verarbeite Server (Logs abrufen)
-            await process_server(server, channel)
-            
-            # Debug-Info
-            logger.info(f"[{server['name']}] Match-Status: ID={state['current_match_id']}, Rewarded={state['match_rewarded']}, Kills={len(state['match_kills'])}")
-            
-            # Nur Live-Update wenn Match lÃ¤uft und nicht belohnt
-            if (
-                state["current_match_id"]
-                and not state["match_rewarded"]
-                and not state.get("inactive_since")
-                and not state.get("paused_low_pop")
-            ):
-                current_map = state.get("current_map") or "Unknown"
-                embed = create_live_embed(server, state, current_map)
-                
-                logger.info(f"[{server['name']}] Versuche Discord-Message zu senden...")
-                
-                if state["live_message"]:
-                    # Update existierende Message
-                    try:
-                        if not state.get("live_message_id"):
-                            state["live_message_id"] = state["live_message"].id
-                        await state["live_message"].edit(embed=embed)
-                        logger.info(f"[{server['name']}] âœ“ Live-Message aktualisiert")
-                    except discord.NotFound:
-                        # Message wurde gelÃ¶scht, erstelle neue
-                        state["live_message"] = await channel.send(embed=embed)
-                        state["live_message_id"] = state["live_message"].id
-                        logger.info(f"[{server['name']}] âœ“ Live-Message neu erstellt (alte gelÃ¶scht)")
-                    except Exception as e:
-                        logger.error(f"[{server['name']}] âœ— Fehler beim Update der Live-Message: {e}", exc_info=True)
-                else:
-                    # Erstelle neue Live-Message
-                    try:
-                        state["live_message"] = await channel.send(embed=embed)
-                        state["live_message_id"] = state["live_message"].id
-                        logger.info(f"[{server['name']}] âœ“ Live-Message erstellt")
-                    except Exception as e:
-                        logger.error(f"[{server['name']}] âœ— Fehler beim Erstellen der Live-Message: {e}", exc_info=True)
-
-        save_state()
+        tick_started = time.monotonic()
+        # Nur faellige Server abfragen (adaptives Intervall pro Server), diese parallel
+        due_servers = [
+            server for server in servers
+            if server_states[server["base_url"]].get("next_poll_at", 0.0) <= tick_started + POLL_INTERVAL_MIN_SECONDS / 2
+        ]
+        if not due_servers:
+            return
+        await asyncio.gather(*[_update_server_guarded(server, channel) for server in due_servers])
+        logger.info(f"[TICK] {len(due_servers)}/{len(servers)} Server verarbeitet in {time.monotonic() - tick_started:.2f}s")
+
+        await save_state()
     
     except Exception as e:
         logger.error(f"Fehler in update_live_stats: {e}", exc_info=True)
@@ -1214,12 +2932,22 @@ async def daily_restart_check():
 
     if now.hour > RESTART_HOUR or (now.hour == RESTART_HOUR and now.minute >= RESTART_MINUTE):
         last_restart_date = today_str
-        save_state(force=True)
+        await save_state(force=True)
         logger.info(f"[RESTART] TÃ¤glicher Neustart ausgelÃ¶st um {RESTART_HOUR:02d}:{RESTART_MINUTE:02d}")
         await bot.close()
         os.execv(sys.executable, [sys.executable] + sys.argv)
 
 
+@tasks.loop(minutes=5)
+async def log_transport_stats():
+    """Verbindungs-Wiederverwendung und Latenz der CRCON-Requests loggen"""
+    if shutdown_requested:
+        log_transport_stats.cancel()
+        return
+    for server in servers:
+        log_http_stats(server)
+
+
 async def restore_live_messages(channel):
     for server in servers:
         state = server_states[server["base_url"]]
@@ -1276,11 +3004,22 @@ async def on_ready():
         daily_restart_check.start()
         logger.info("âœ“ Daily-Restart Task gestartet")
 
-    save_state(force=True)
+    if not log_transport_stats.is_running():
+        log_transport_stats.start()
+
+    await award_pipeline.start()
+
+    await save_state(force=True)
 
 
 async def main():
     """Hauptfunktion"""
+    global poll_semaphore, state_write_lock
+    poll_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SERVERS)
+    state_write_lock = asyncio.Lock()
+    for server in servers:
+        server["client"] = AsyncCrconClient(server)
+
     try:
         await bot.start(DISCORD_BOT_TOKEN)
     except KeyboardInterrupt:
@@ -1288,9 +3027,15 @@ async def main():
     except Exception as e:
         logger.error(f"Fataler Fehler: {e}", exc_info=True)
     finally:
-        save_state(force=True)
+        await save_state(force=True)
+        await award_pipeline.stop()
+        await discord_scheduler.stop()
+        for server in servers:
+            await _pm_dispatcher(server).stop()
         if not bot.is_closed():
             await bot.close()
+        for server in servers:
+            await server["client"].close()
         logger.info("[SHUTDOWN] Bot beendet")
 
 
@@ -1298,6 +3043,7 @@ if __name__ == "__main__":
     try:
         ensure_data_dir()
         load_state()
+        award_pipeline.load()
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Bot gestoppt")